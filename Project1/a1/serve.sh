@@ -0,0 +1,6 @@
+#!/bin/bash
+
+# Serve the web app with gunicorn + gevent workers so concurrent /enrich
+# requests don't block each other while waiting on Wikidata
+cd src
+exec gunicorn app:app -k gevent -w 4 --worker-connections 1000 --bind 0.0.0.0:5000
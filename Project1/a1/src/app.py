@@ -1,15 +1,64 @@
-from flask import Flask, render_template, request, jsonify
+# Patch blocking I/O (sockets used by requests, sleeps) before anything imports it,
+# so one gevent worker can serve many /enrich requests waiting on Wikidata
+from gevent import monkey
+monkey.patch_all()
+
+import os
+import orjson
+from functools import lru_cache
+from gevent import get_hub
+from flask import Flask, render_template, request
 from entity_extractor import EntityExtractor
+from ingest_entity_extractor import IngestEntityExtractor
 from relationship_extractor import RelationshipExtractor
 from wikidata_client import WikidataClient, batch_enrich_entities, batch_enrich_relationships
+from nlp_pipeline import get_nlp
 
 app = Flask(__name__)
 
-# Initialize extractors
+# With LAZY_SPACY=1, /process uses the fast regex extractor and full spaCy
+# NER + dependency parsing is deferred to /enrich
+app.config['LAZY_SPACY'] = os.environ.get('LAZY_SPACY', '0') == '1'
+
+# Number of recently parsed texts whose extraction results are kept in memory
+EXTRACTION_CACHE_SIZE = 256
+
+# Initialize extractors (both share one spaCy pipeline)
+nlp = get_nlp()
 entity_extractor = EntityExtractor()
+ingest_entity_extractor = IngestEntityExtractor()
 relationship_extractor = RelationshipExtractor()
 wikidata_client = WikidataClient()
 
+def parse_text(text):
+    """
+    Run the spaCy pipeline on a real OS thread from gevent's threadpool so the
+    CPU-bound parse doesn't block the event loop serving other requests.
+    """
+    return get_hub().threadpool.apply(nlp, (text,))
+
+@lru_cache(maxsize=EXTRACTION_CACHE_SIZE)
+def extract_from_text(text):
+    """
+    Parse text once and extract its entities and relationships.
+    
+    Results are cached per text, so re-submitting the same text (common while
+    iterating in the UI) skips the spaCy parse entirely. Callers must treat the
+    returned structures as read-only; call extract_from_text.cache_clear() if
+    the pipeline is reloaded.
+    """
+    doc = parse_text(text)
+    entities = entity_extractor.extract_entities(text, doc)
+    relationships = relationship_extractor.extract_relationships(text, entities, doc)
+    return entities, relationships
+
+def json_response(payload, status=200):
+    """
+    Serialize a response body with orjson, which is several times faster than
+    Flask's stdlib-based encoder on large entity/relationship payloads.
+    """
+    return app.response_class(orjson.dumps(payload), status=status, mimetype='application/json')
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -20,15 +69,19 @@ def process_text():
     text = data.get('text', '')
     
     if not text:
-        return jsonify({'error': 'No text provided'}), 400
+        return json_response({'error': 'No text provided'}, 400)
     
-    # Extract entities
-    entities = entity_extractor.extract_entities(text)
+    if app.config['LAZY_SPACY']:
+        # Fast path: regex candidates only, relationships are found in /enrich
+        return json_response({
+            'entities': ingest_entity_extractor.extract_entities(text),
+            'relationships': []
+        })
     
-    # Extract relationships
-    relationships = relationship_extractor.extract_relationships(text, entities)
+    # Parse once and share the doc between both extractors (cached per text)
+    entities, relationships = extract_from_text(text)
     
-    return jsonify({
+    return json_response({
         'entities': entities,
         'relationships': relationships
     })
@@ -41,40 +94,51 @@ def enrich_with_wikidata():
     data = request.json
     entities = data.get('entities', [])
     relationships = data.get('relationships', [])
+    text = data.get('text', '')
+    
+    if app.config['LAZY_SPACY'] and text:
+        # /process only ran the regex extractor, so run the accurate spaCy path now
+        spacy_entities, relationships = extract_from_text(text)
+        entities = spacy_entities['unique_entities']
     
     if not entities:
-        return jsonify({'error': 'No entities provided'}), 400
+        return json_response({'error': 'No entities provided'}, 400)
     
-    # Enrich entities
-    enriched_entities = batch_enrich_entities(
-        wikidata_client, 
-        [e['text'] for e in entities]
-    )
+    # Enrich each distinct entity text once, then expand back to one result per entity
+    unique_texts = list(dict.fromkeys(e['text'] for e in entities))
+    text_to_enriched = {
+        e['original_text']: e
+        for e in batch_enrich_entities(wikidata_client, unique_texts)
+    }
+    enriched_entities = [text_to_enriched[e['text']] for e in entities]
     
     # Create QID mapping for relationship enrichment
     entity_qid_map = {
-        e['original_text']: e['qid'] 
-        for e in enriched_entities if e['qid']
+        text: e['qid']
+        for text, e in text_to_enriched.items() if e['qid']
     }
     
-    # Enrich relationships
+    # Enrich each distinct (subject, object) pair once, then expand the same way
     enriched_relationships = []
     if relationships:
         relationship_pairs = [
             (r['subject'], r['object']) 
             for r in relationships
         ]
-        enriched_relationships = batch_enrich_relationships(
+        unique_pairs = list(dict.fromkeys(relationship_pairs))
+        pair_to_enriched = dict(zip(unique_pairs, batch_enrich_relationships(
             wikidata_client,
-            relationship_pairs,
+            unique_pairs,
             entity_qid_map
-        )
+        )))
+        enriched_relationships = [pair_to_enriched[pair] for pair in relationship_pairs]
     
-    return jsonify({
+    return json_response({
         'enriched_entities': enriched_entities,
         'enriched_relationships': enriched_relationships
     })
 
 
 if __name__ == '__main__':
+    # Development server; use serve.sh (gunicorn + gevent workers) for concurrent clients
     app.run(debug=True, port=5000)
\ No newline at end of file
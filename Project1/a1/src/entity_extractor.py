@@ -1,17 +1,26 @@
-import spacy
 import re
+from collections import defaultdict
+from nlp_pipeline import get_nlp
 
 class EntityExtractor:
+    # Patterns used by _clean_entity_text, compiled once
+    _MISMATCHED_QUOTE = re.compile(r'(\w+)"(\s+\w+)')
+    _LEADING_QUOTE = re.compile(r'^"(\w+)')
+    _WHITESPACE = re.compile(r'\s+')
+    
     def __init__(self):
-        # Load spaCy model
-        self.nlp = spacy.load("en_core_web_sm")
+        # Shared spaCy model (loaded once per process)
+        self.nlp = get_nlp()
     
-    def extract_entities(self, text):
+    def extract_entities(self, text, doc=None):
         """
         Extract named entities from text using spaCy.
         Returns a list of entities with their labels and positions.
+        
+        Pass an already-parsed doc to avoid parsing the text again.
         """
-        doc = self.nlp(text)
+        if doc is None:
+            doc = self.nlp(text)
         entities = []
         entity_map = {}  # Map to track unique entities
         
@@ -35,7 +44,7 @@ class EntityExtractor:
                 }
         
         # Merge overlapping or related person entities
-        unique_entities = self._merge_person_entities(list(entity_map.values()), entities)
+        unique_entities = self._merge_person_entities(list(entity_map.values()))
         
         return {
             'mentions': entities,
@@ -47,17 +56,17 @@ class EntityExtractor:
         Clean entity text by fixing malformed quotes and other issues.
         """
         # Fix mismatched quotes (like Casey" Stengel)
-        text = re.sub(r'(\w+)"(\s+\w+)', r'\1 \2', text)
+        text = self._MISMATCHED_QUOTE.sub(r'\1 \2', text)
         
         # Remove stray quotes at the beginning
-        text = re.sub(r'^"(\w+)', r'\1', text)
+        text = self._LEADING_QUOTE.sub(r'\1', text)
         
         # Clean up extra whitespace
-        text = ' '.join(text.split())
+        text = self._WHITESPACE.sub(' ', text).strip()
         
         return text
     
-    def _merge_person_entities(self, unique_entities, all_entities):
+    def _merge_person_entities(self, unique_entities):
         """
         Merge person entities that are likely referring to the same person.
         For example, merge "Charles Dillon", "Casey Stengel", and "Stengel" into one.
@@ -68,6 +77,21 @@ class EntityExtractor:
         if len(person_entities) <= 1:
             return unique_entities
         
+        # Blocking: names can only match if they share a whole token (a common
+        # last name, or one name appearing as words inside the other), so compare
+        # each person against the names sharing one of its tokens instead of
+        # every other person
+        # Normalize each name once here rather than inside every pairwise comparison
+        names = [e['text'].lower() for e in person_entities]
+        name_parts = [name.split() for name in names]
+        last_names = [(parts or [''])[-1] for parts in name_parts]
+        part_counts = [len(parts) for parts in name_parts]
+        
+        token_index = defaultdict(list)  # token -> indices of persons containing it
+        for index, parts in enumerate(name_parts):
+            for token in set(parts):
+                token_index[token].append(index)
+        
         # Group entities by proximity in text
         merged_persons = []
         used_indices = set()
@@ -76,18 +100,20 @@ class EntityExtractor:
             if i in used_indices:
                 continue
             
-            # Find the full occurrence of this person in the text
-            person1_mentions = [e for e in all_entities if e['text'] == person1['text']]
-            
             candidates = [person1]
+            candidate_indices = {j for token in set(name_parts[i]) for j in token_index[token]}
             
-            for j, person2 in enumerate(person_entities):
+            for j in sorted(candidate_indices):
                 if i == j or j in used_indices:
                     continue
                 
+                person2 = person_entities[j]
+                
                 # Check if person2 is a substring or superset of person1
                 # or if they appear close together (likely the same person)
-                if self._are_same_person(person1['text'], person2['text']):
+                if self._are_same_normalized_person(
+                    names[i], names[j], last_names[i], last_names[j], part_counts[i], part_counts[j]
+                ):
                     candidates.append(person2)
                     used_indices.add(j)
             
@@ -105,20 +131,23 @@ class EntityExtractor:
         # Normalize names
         name1_lower = name1.lower()
         name2_lower = name2.lower()
+        name1_parts = name1_lower.split()
+        name2_parts = name2_lower.split()
         
-        # One is a substring of the other
-        if name1_lower in name2_lower or name2_lower in name1_lower:
+        return self._are_same_normalized_person(
+            name1_lower, name2_lower,
+            (name1_parts or [''])[-1], (name2_parts or [''])[-1],
+            len(name1_parts), len(name2_parts)
+        )
+    
+    def _are_same_normalized_person(self, name1_lower, name2_lower, last_name1, last_name2,
+                                    part_count1, part_count2):
+        """
+        Same check as _are_same_person on names that were already lowercased and split.
+        """
+        # Share a last name and at least one is a full name (cheap string compare first)
+        if last_name1 == last_name2 and (part_count1 > 1 or part_count2 > 1):
             return True
         
-        # Share a last name (simple heuristic)
-        name1_parts = name1.split()
-        name2_parts = name2.split()
-        
-        if len(name1_parts) > 0 and len(name2_parts) > 0:
-            # Check if last names match
-            if name1_parts[-1].lower() == name2_parts[-1].lower():
-                # If they share a last name and have length > 1, likely same person
-                if len(name1_parts) > 1 or len(name2_parts) > 1:
-                    return True
-        
-        return False
\ No newline at end of file
+        # One is a substring of the other
+        return name1_lower in name2_lower or name2_lower in name1_lower
@@ -2,15 +2,37 @@ import argparse
 import json
 from entity_extractor import EntityExtractor
 from relationship_extractor import RelationshipExtractor
-from wikidata_client import WikidataClient
+from wikidata_client import WikidataClient, batch_shortest_relationships
+from nlp_pipeline import get_nlp
+
+# Write buffer for the output file, so lines are flushed in large blocks
+OUTPUT_BUFFER_SIZE = 1 << 16
+
+def format_output_line(subject, subject_qid, predicate, predicate_pid, obj, object_qid):
+    """
+    Format one output record as a single-quoted dict literal.
+    
+    repr() already uses single quotes unless the value itself contains one,
+    so the line stays a valid Python literal for any input text.
+    """
+    return (
+        f"{{'subject': {subject!r}, 'subject_qid': {subject_qid!r}, "
+        f"'predicate': {predicate!r}, 'predicate_pid': {predicate_pid!r}, "
+        f"'object': {obj!r}, 'object_qid': {object_qid!r}}}"
+    )
 
 def main():
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Extract entities and relationships from text')
     parser.add_argument('--input', required=True, help='Input text file')
     parser.add_argument('--output', required=True, help='Output file')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Print progress for every entity and relationship')
     args = parser.parse_args()
     
+    # Per-item progress is only printed with --verbose; the summary always is
+    log = print if args.verbose else (lambda *_args, **_kwargs: None)
+    
     # Read input
     with open(args.input, 'r') as f:
         text = f.read().strip()
@@ -20,91 +42,83 @@ def main():
     relationship_extractor = RelationshipExtractor()
     wikidata_client = WikidataClient()
     
-    # Extract entities and relationships
-    entities = entity_extractor.extract_entities(text)
-    relationships = relationship_extractor.extract_relationships(text, entities)
+    # Extract entities and relationships (parse the text only once)
+    doc = get_nlp()(text)
+    entities = entity_extractor.extract_entities(text, doc)
+    relationships = relationship_extractor.extract_relationships(text, entities, doc)
     
-    # Enrich entities with Wikidata
+    # Enrich entities with Wikidata (batched SPARQL search instead of one request per entity)
     entity_qid_map = {}
     entity_label_map = {}
     
-    print(f"Extracting {len(entities['unique_entities'])} entities...")
+    log(f"Extracting {len(entities['unique_entities'])} entities...")
+    entity_matches = wikidata_client.batch_search_entities(
+        [entity['text'] for entity in entities['unique_entities']]
+    )
     for entity in entities['unique_entities']:
         entity_text = entity['text']
-        entity_info = wikidata_client.search_entity(entity_text)
+        entity_info = entity_matches.get(entity_text)
         if entity_info:
             entity_qid_map[entity_text] = entity_info['qid']
             entity_label_map[entity_text] = entity_info['label']
-            print(f"  - {entity_text} -> {entity_info['qid']}")
+            log(f"  - {entity_text} -> {entity_info['qid']}")
         else:
-            print(f"  - {entity_text} -> No QID found")
+            log(f"  - {entity_text} -> No QID found")
     
-    # Write output in the specified format
-    output_lines = []
+    # Look up the relationships for all entity pairs in batched SPARQL queries
+    qid_pairs = [
+        (entity_qid_map[rel['subject']], entity_qid_map[rel['object']])
+        for rel in relationships
+        if rel['subject'] in entity_qid_map and rel['object'] in entity_qid_map
+    ]
+    shortest_relationships = batch_shortest_relationships(wikidata_client, qid_pairs)
+    
+    # Write output in the specified format, streaming each line to disk as it is produced
     processed_entities = set()  # Track which entities are used in relationships
+    line_count = 0
     
-    print(f"\nEnriching {len(relationships)} relationships...")
-    for rel in relationships:
-        subject = rel['subject']
-        obj = rel['object']
-        
-        subject_qid = entity_qid_map.get(subject)
-        object_qid = entity_qid_map.get(obj)
-        
-        if subject_qid and object_qid:
-            # Find relationship from Wikidata
-            relationship_info = wikidata_client.get_shortest_relationship(subject_qid, object_qid)
+    with open(args.output, 'w', buffering=OUTPUT_BUFFER_SIZE) as output_file:
+        log(f"\nEnriching {len(relationships)} relationships...")
+        for rel in relationships:
+            subject = rel['subject']
+            obj = rel['object']
             
-            if relationship_info:
-                predicate = relationship_info['label']
-                predicate_pid = relationship_info['property_id']
-                
-                output_dict = {
-                    'subject': subject,
-                    'subject_qid': subject_qid,
-                    'predicate': predicate,
-                    'predicate_pid': predicate_pid,
-                    'object': obj,
-                    'object_qid': object_qid
-                }
+            subject_qid = entity_qid_map.get(subject)
+            object_qid = entity_qid_map.get(obj)
+            
+            if subject_qid and object_qid:
+                # Find relationship from Wikidata
+                relationship_info = shortest_relationships.get((subject_qid, object_qid))
                 
-                # Format as requested: single quotes for JSON
-                output_line = str(output_dict).replace('"', "'")
-                output_lines.append(output_line)
-                processed_entities.add(subject)
-                processed_entities.add(obj)
-                print(f"  ✓ ({subject}, {predicate}, {obj})")
+                if relationship_info:
+                    predicate = relationship_info['label']
+                    predicate_pid = relationship_info['property_id']
+                    
+                    # Format as requested: single-quoted dict literal
+                    output_line = format_output_line(subject, subject_qid, predicate, predicate_pid, obj, object_qid)
+                    output_file.write(output_line + '\n')
+                    line_count += 1
+                    processed_entities.add(subject)
+                    processed_entities.add(obj)
+                    log(f"  ✓ ({subject}, {predicate}, {obj})")
+                else:
+                    log(f"  ✗ No relationship found between {subject} and {obj}")
             else:
-                print(f"  ✗ No relationship found between {subject} and {obj}")
-        else:
-            if not subject_qid:
-                print(f"  ✗ Missing QID for subject: {subject}")
-            if not object_qid:
-                print(f"  ✗ Missing QID for object: {obj}")
-    
-    # Add entities that have QIDs but no relationships (Task-1 only)
-    print(f"\nAdding entities without relationships...")
-    for entity_text, entity_qid in entity_qid_map.items():
-        if entity_text not in processed_entities:
-            output_dict = {
-                'subject': entity_text,
-                'subject_qid': entity_qid,
-                'predicate': '',
-                'predicate_pid': '',
-                'object': '',
-                'object_qid': ''
-            }
-            output_line = str(output_dict).replace('"', "'")
-            output_lines.append(output_line)
-            print(f"  + {entity_text} ({entity_qid})")
-    
-    # Write output
-    with open(args.output, 'w') as f:
-        for line in output_lines:
-            f.write(line + '\n')
+                if not subject_qid:
+                    log(f"  ✗ Missing QID for subject: {subject}")
+                if not object_qid:
+                    log(f"  ✗ Missing QID for object: {obj}")
+        
+        # Add entities that have QIDs but no relationships (Task-1 only)
+        log(f"\nAdding entities without relationships...")
+        for entity_text, entity_qid in entity_qid_map.items():
+            if entity_text not in processed_entities:
+                output_line = format_output_line(entity_text, entity_qid, '', '', '', '')
+                output_file.write(output_line + '\n')
+                line_count += 1
+                log(f"  + {entity_text} ({entity_qid})")
     
-    print(f"\nOutput written to {args.output}")
-    print(f"Total lines: {len(output_lines)}")
+    print(f"Output written to {args.output} ({line_count} lines)")
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,62 @@
+import re
+
+# Runs of 1-4 capitalized words, e.g. "Casey Stengel" or "New York Yankees"
+CANDIDATE_PATTERN = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,3}\b')
+WORD_PATTERN = re.compile(r'\S+')
+
+# Capitalized words that are usually sentence starters rather than names
+STOP_WORDS = {
+    'A', 'An', 'And', 'As', 'At', 'But', 'By', 'For', 'From', 'He', 'Her', 'His',
+    'I', 'If', 'In', 'It', 'Its', 'Mr', 'Mrs', 'Ms', 'Dr', 'On', 'Or', 'She',
+    'So', 'That', 'The', 'Their', 'Then', 'There', 'These', 'They', 'This',
+    'Those', 'To', 'We', 'When', 'While', 'With', 'You'
+}
+
+class IngestEntityExtractor:
+    """
+    Fast regex-based entity extractor for the ingest path.
+    
+    Finds capitalized proper-noun candidates in milliseconds instead of running
+    full spaCy NER. Results have the same shape as EntityExtractor.extract_entities,
+    so callers can switch between the two.
+    """
+    
+    def extract_entities(self, text):
+        """
+        Extract candidate entities from text using a capitalized-word regex.
+        Returns a list of entities with their labels and positions.
+        """
+        entities = []
+        entity_map = {}  # Map to track unique entities
+        
+        for match in CANDIDATE_PATTERN.finditer(text):
+            # (offset, word) pairs within the match
+            words = [(word.start(), word.group()) for word in WORD_PATTERN.finditer(match.group())]
+            
+            # Drop leading stop words ("The United Nations" -> "United Nations")
+            while words and words[0][1] in STOP_WORDS:
+                words.pop(0)
+            
+            if not words:
+                continue
+            
+            start = match.start() + words[0][0]
+            candidate = ' '.join(word for _, word in words)
+            entity_info = {
+                'text': candidate,
+                'label': 'CANDIDATE',
+                'start': start,
+                'end': match.end()
+            }
+            entities.append(entity_info)
+            
+            if candidate not in entity_map:
+                entity_map[candidate] = {
+                    'text': candidate,
+                    'label': 'CANDIDATE'
+                }
+        
+        return {
+            'mentions': entities,
+            'unique_entities': list(entity_map.values())
+        }
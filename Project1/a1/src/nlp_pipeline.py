@@ -0,0 +1,12 @@
+import spacy
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def get_nlp():
+    """
+    Load the spaCy pipeline once per process and share it between extractors.
+    
+    Every component is kept: relationship extraction needs the attribute_ruler
+    for token.pos_ and the lemmatizer for lemma predicates.
+    """
+    return spacy.load("en_core_web_sm")
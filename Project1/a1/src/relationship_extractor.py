@@ -1,15 +1,26 @@
-import spacy
+from nlp_pipeline import get_nlp
+
+# Coarse POS tags of tokens that can head a relationship
+VERB_POS = {"VERB", "AUX"}
+
+# Dependency labels used to find subjects and objects
+SUBJECT_DEPS = {"nsubj", "nsubjpass"}
+OBJECT_DEPS = {"dobj", "attr"}
 
 class RelationshipExtractor:
     def __init__(self):
-        self.nlp = spacy.load("en_core_web_sm")
+        # Shared spaCy model (loaded once per process)
+        self.nlp = get_nlp()
     
-    def extract_relationships(self, text, entities):
+    def extract_relationships(self, text, entities, doc=None):
         """
         Extract relationships between entities using dependency parsing.
         Returns a list of (subject, predicate, object) triplets.
+        
+        Pass the doc already parsed for entity extraction to avoid parsing the text again.
         """
-        doc = self.nlp(text)
+        if doc is None:
+            doc = self.nlp(text)
         relationships = []
         
         # Create a mapping from token indices to entity text
@@ -18,17 +29,21 @@ class RelationshipExtractor:
             for token in ent:
                 token_to_entity[token.i] = ent.text
         
+        # Entity lookups per token index, shared by every verb in this doc
+        entity_cache = {}
+        
         # Look for verbs and auxiliaries that might indicate relationships
         for token in doc:
-            if token.pos_ in ["VERB", "AUX"]:
+            if token.pos_ in VERB_POS:
                 subject_entity = None
                 object_entity = None
-                predicate = token.lemma_
+                lemma = token.lemma_
+                predicate = lemma
                 
                 # Find subject
                 for child in token.children:
-                    if child.dep_ in ["nsubj", "nsubjpass"]:
-                        subject_entity = self._get_entity_for_token(child, token_to_entity)
+                    if child.dep_ in SUBJECT_DEPS:
+                        subject_entity = self._get_entity_for_token(child, token_to_entity, entity_cache)
                 
                 # Find object through prepositional phrases or direct objects
                 for child in token.children:
@@ -36,17 +51,17 @@ class RelationshipExtractor:
                         # Look for pobj under the preposition
                         for prep_child in child.children:
                             if prep_child.dep_ == "pobj":
-                                object_entity = self._get_entity_for_token(prep_child, token_to_entity)
+                                object_entity = self._get_entity_for_token(prep_child, token_to_entity, entity_cache)
                                 if subject_entity and object_entity:
                                     # Include preposition in predicate
-                                    predicate = f"{token.lemma_} {child.text}"
+                                    predicate = f"{lemma} {child.text}"
                                     relationships.append({
                                         'subject': subject_entity,
                                         'predicate': predicate,
                                         'object': object_entity
                                     })
-                    elif child.dep_ in ["dobj", "attr"]:
-                        object_entity = self._get_entity_for_token(child, token_to_entity)
+                    elif child.dep_ in OBJECT_DEPS:
+                        object_entity = self._get_entity_for_token(child, token_to_entity, entity_cache)
                         if subject_entity and object_entity:
                             relationships.append({
                                 'subject': subject_entity,
@@ -54,7 +69,7 @@ class RelationshipExtractor:
                                 'object': object_entity
                             })
                     elif child.dep_ == "pobj":
-                        object_entity = self._get_entity_for_token(child, token_to_entity)
+                        object_entity = self._get_entity_for_token(child, token_to_entity, entity_cache)
                         if subject_entity and object_entity:
                             relationships.append({
                                 'subject': subject_entity,
@@ -64,22 +79,33 @@ class RelationshipExtractor:
         
         return relationships
     
-    def _get_entity_for_token(self, token, token_to_entity):
+    def _get_entity_for_token(self, token, token_to_entity, entity_cache=None):
         """
         Get the entity text for a token, following compound and proper noun chains.
+        
+        Results are memoized in entity_cache (keyed by token index) so repeated
+        lookups don't walk the same subtree again.
         """
         # Check if token is directly mapped to an entity
         if token.i in token_to_entity:
             return token_to_entity[token.i]
         
-        # Check if any child tokens are entities (for compound structures)
-        for child in token.children:
-            if child.i in token_to_entity:
-                return token_to_entity[child.i]
+        if entity_cache is not None and token.i in entity_cache:
+            return entity_cache[token.i]
         
-        # Check the token's subtree for entities
-        for descendant in token.subtree:
-            if descendant.i in token_to_entity:
-                return token_to_entity[descendant.i]
+        # Check if any child tokens are entities (for compound structures),
+        # then the token's subtree
+        entity = next(
+            (token_to_entity[child.i] for child in token.children if child.i in token_to_entity),
+            None
+        )
+        if entity is None:
+            entity = next(
+                (token_to_entity[descendant.i] for descendant in token.subtree
+                 if descendant.i in token_to_entity),
+                None
+            )
         
-        return None
+        if entity_cache is not None:
+            entity_cache[token.i] = entity
+        return entity
@@ -10,7 +10,7 @@ document.addEventListener('DOMContentLoaded', function() {
     
     enrichBtn.addEventListener('click', function() {
         if (window.currentData) {
-            enrichWithWikidata(window.currentData.entities, window.currentData.relationships);
+            enrichWithWikidata(window.currentData.entities, window.currentData.relationships, window.currentData.text);
         }
     });
     
@@ -42,6 +42,7 @@ document.addEventListener('DOMContentLoaded', function() {
             
             // Store data for enrichment
             window.currentData = data;
+            window.currentData.text = text;
             
             // Enable enrichment button
             const enrichBtn = document.getElementById('enrichBtn');
@@ -55,7 +56,7 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
-    async function enrichWithWikidata(entities, relationships) {
+    async function enrichWithWikidata(entities, relationships, text) {
         try {
             const response = await fetch('/enrich', {
                 method: 'POST',
@@ -64,7 +65,8 @@ document.addEventListener('DOMContentLoaded', function() {
                 },
                 body: JSON.stringify({
                     entities: entities.unique_entities,
-                    relationships: relationships
+                    relationships: relationships,
+                    text: text
                 })
             });
             
@@ -1,15 +1,226 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
-from typing import List, Dict, Optional, Tuple
+import hashlib
+import json
+import orjson
+import os
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, Optional, Tuple
+
+# On-disk cache for Wikidata responses, shared across runs
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wikidata_cache.db')
+CACHE_TTL_SECONDS = 30 * 24 * 60 * 60  # 30 days
+
+# How long a cache read/write waits on another process's lock before giving
+# up; kept short so a busy cache never stalls a gevent worker
+CACHE_BUSY_TIMEOUT_SECONDS = 0.5
+
+# Top-level keys of a successful wbsearchentities, wbgetentities, or SPARQL
+# response; anything else (e.g. an 'error' body sent with HTTP 200) is not cached
+CACHEABLE_RESPONSE_KEYS = ('search', 'entities', 'results')
+
+# In-process LRU in front of the on-disk cache
+MEMORY_CACHE_SIZE = 4096
+
+# Maximum number of IDs wbgetentities accepts in one request
+WBGETENTITIES_BATCH_SIZE = 50
+
+# Entity (QID) and property (PID) IDs; anything else would make wbgetentities
+# reject the whole batch
+WIKIDATA_ID = re.compile(r'^[QP]\d+$')
+
+# Maximum number of search strings sent in one SPARQL MWAPI query
+SPARQL_SEARCH_BATCH_SIZE = 50
+
+# Maximum number of (subject, object) pairs sent in one SPARQL relationship query
+SPARQL_PAIR_BATCH_SIZE = 50
+
+# Global request budget shared by all worker threads
+DEFAULT_REQUESTS_PER_SECOND = 5.0
+DEFAULT_MAX_WORKERS = 8
+
+# Keep-alive connections per host, sized above the worker count so concurrent
+# batches and Flask requests never wait for a free connection
+HTTP_POOL_SIZE = 32
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket that limits how many requests per second are sent.
+    """
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                wait = (1 - self.tokens) / self.rate
+            
+            time.sleep(wait)
+
 
 class WikidataClient:
-    def __init__(self):
+    def __init__(self, cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+                 requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND):
         self.api_url = "https://www.wikidata.org/w/api.php"
         self.sparql_url = "https://query.wikidata.org/sparql"
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'EntityRelationshipExplorer/1.0'
         })
+        
+        # Retry rate-limited/unavailable responses with exponential backoff.
+        # POST is included because SPARQL queries sent by POST are read-only.
+        retry = Retry(
+            total=3,
+            backoff_factor=1.0,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['GET', 'POST']),
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+        self.session.mount("https://", adapter)
+        
+        # Rate limit only real network requests; cache hits are never throttled
+        self.rate_limiter = RateLimiter(requests_per_second)
+        
+        # Open the cache once per client; pass cache_path=None to disable it
+        self._cache = None
+        self._cache_lock = threading.Lock()
+        self._memory_cache = OrderedDict()
+        if cache_path:
+            try:
+                self._cache = sqlite3.connect(cache_path, timeout=CACHE_BUSY_TIMEOUT_SECONDS,
+                                              check_same_thread=False)
+                # WAL lets the serve.sh worker processes read while one of them writes
+                self._cache.execute("PRAGMA journal_mode=WAL")
+                self._cache.execute(
+                    "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, ts REAL)"
+                )
+                self._cache.commit()
+            except sqlite3.Error as e:
+                print(f"Error opening Wikidata cache at {cache_path}, continuing without it: {e}")
+                self._cache = None
+    
+    def _cache_key(self, url: str, params: Dict) -> str:
+        """Build a stable cache key from the endpoint and its query parameters."""
+        raw = f"{url}:{json.dumps(params, sort_keys=True)}"
+        return hashlib.blake2b(raw.encode('utf-8')).hexdigest()
+    
+    def _memory_get(self, key: str) -> Optional[Any]:
+        """Return the response memoized in this process for key, or None."""
+        with self._cache_lock:
+            value = self._memory_cache.get(key)
+            if value is not None:
+                self._memory_cache.move_to_end(key)
+            return value
+    
+    def _memory_set(self, key: str, value: Any):
+        """Memoize a response in this process, evicting the least recently used."""
+        with self._cache_lock:
+            self._memory_cache[key] = value
+            self._memory_cache.move_to_end(key)
+            if len(self._memory_cache) > MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+    
+    def _cache_get(self, key: str) -> Optional[Any]:
+        """Return the cached response for key, or None if missing, expired, or unreadable."""
+        if self._cache is None:
+            return None
+        
+        try:
+            with self._cache_lock:
+                row = self._cache.execute(
+                    "SELECT value, ts FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading Wikidata cache, treating as a miss: {e}")
+            return None
+        
+        if row is None or time.time() - row[1] > CACHE_TTL_SECONDS:
+            return None
+        return orjson.loads(row[0])
+    
+    def _cache_set(self, key: str, value: Any):
+        """Store a response in the cache; a failed write is logged and skipped."""
+        if self._cache is None:
+            return
+        
+        try:
+            with self._cache_lock:
+                self._cache.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)",
+                    (key, orjson.dumps(value), time.time())
+                )
+                self._cache.commit()
+        except sqlite3.Error as e:
+            print(f"Error writing Wikidata cache, skipping: {e}")
+            try:
+                with self._cache_lock:
+                    if self._cache.in_transaction:
+                        self._cache.rollback()
+            except sqlite3.Error:
+                pass
+    
+    def _fetch_json(self, url: str, params: Dict, timeout: int, method: str = 'GET') -> Any:
+        """
+        Request a Wikidata endpoint and return the decoded JSON.
+        
+        Lookups go through an in-process LRU first, then the on-disk cache.
+        
+        Long SPARQL queries should use method='POST' to stay under URL length limits.
+        Failed requests raise and are never cached, so callers can keep their
+        existing error handling. API error bodies are returned but not cached.
+        Cache errors never raise: a failed read is a miss and a failed write
+        still returns the fetched response.
+        """
+        key = self._cache_key(url, params)
+        cached = self._memory_get(key)
+        if cached is not None:
+            return cached
+        
+        cached = self._cache_get(key)
+        if cached is not None:
+            self._memory_set(key, cached)
+            return cached
+        
+        self.rate_limiter.acquire()
+        if method == 'POST':
+            response = self.session.post(url, data=params, timeout=timeout)
+        else:
+            response = self.session.get(url, params=params, timeout=timeout)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        if self._is_cacheable(data):
+            self._cache_set(key, data)
+            self._memory_set(key, data)
+        return data
+    
+    @staticmethod
+    def _is_cacheable(data: Any) -> bool:
+        """Only cache successful responses, never API error or timeout bodies."""
+        return (isinstance(data, dict) and 'error' not in data
+                and any(k in data for k in CACHEABLE_RESPONSE_KEYS))
     
     def search_entity(self, entity_text: str) -> Optional[Dict]:
         """
@@ -31,9 +242,7 @@ class WikidataClient:
         }
         
         try:
-            response = self.session.get(self.api_url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = self._fetch_json(self.api_url, params, timeout=10)
             
             if data.get('search') and len(data['search']) > 0:
                 result = data['search'][0]
@@ -49,73 +258,151 @@ class WikidataClient:
             print(f"Error searching for entity '{entity_text}': {e}")
             return None
     
-    def get_entity_label(self, qid: str) -> Optional[str]:
+    def batch_search_entities(self, texts: List[str]) -> Dict[str, Dict]:
         """
-        Get the label for a specific Wikidata entity QID.
+        Search for many entities at once using a single SPARQL query per batch.
+        
+        The query runs the same EntitySearch (wbsearchentities) lookup as
+        search_entity through the MWAPI service, so one HTTP call resolves up
+        to SPARQL_SEARCH_BATCH_SIZE search strings.
         
         Args:
-            qid: Wikidata QID (e.g., 'Q194057')
+            texts: The entity texts to search for
             
         Returns:
-            The label string if found, None otherwise
+            Dictionary mapping each text that has a match to its 'qid', 'label'
+            and 'description'
         """
-        params = {
-            'action': 'wbgetentities',
-            'format': 'json',
-            'ids': qid,
-            'props': 'labels',
-            'languages': 'en'
-        }
+        matches = {}
+        unique_texts = list(dict.fromkeys(texts))
         
-        try:
-            response = self.session.get(self.api_url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            if 'entities' in data and qid in data['entities']:
-                entity = data['entities'][qid]
-                if 'labels' in entity and 'en' in entity['labels']:
-                    return entity['labels']['en']['value']
+        for start in range(0, len(unique_texts), SPARQL_SEARCH_BATCH_SIZE):
+            chunk = unique_texts[start:start + SPARQL_SEARCH_BATCH_SIZE]
             
-            return None
+            # json.dumps escapes quotes/backslashes the same way SPARQL string literals do
+            values = ' '.join(json.dumps(text, ensure_ascii=False) for text in chunk)
+            query = f"""
+            SELECT ?text ?item ?itemLabel ?itemDescription WHERE {{
+              VALUES ?text {{ {values} }}
+              SERVICE wikibase:mwapi {{
+                bd:serviceParam wikibase:endpoint "www.wikidata.org";
+                                wikibase:api "EntitySearch";
+                                mwapi:search ?text;
+                                mwapi:language "en".
+                ?item wikibase:apiOutputItem mwapi:item.
+                ?ordinal wikibase:apiOrdinal true.
+              }}
+              FILTER(?ordinal = 0)
+              SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en". }}
+            }}
+            """
             
-        except Exception as e:
-            print(f"Error getting label for {qid}: {e}")
-            return None
+            try:
+                data = self._fetch_json(
+                    self.sparql_url,
+                    {'query': query, 'format': 'json'},
+                    timeout=30,
+                    method='POST'
+                )
+                
+                for binding in data.get('results', {}).get('bindings', []):
+                    text = binding['text']['value']
+                    if text in matches or 'item' not in binding:
+                        continue
+                    
+                    matches[text] = {
+                        'qid': binding['item']['value'].split('/')[-1],
+                        'label': binding.get('itemLabel', {}).get('value', text),
+                        'description': binding.get('itemDescription', {}).get('value', '')
+                    }
+                
+            except Exception as e:
+                # Fall back to one search request per text for this batch
+                print(f"Error in batch entity search, searching individually: {e}")
+                for text in chunk:
+                    entity_info = self.search_entity(text)
+                    if entity_info:
+                        matches[text] = entity_info
+        
+        return matches
     
-    def _get_property_label(self, pid: str) -> Optional[str]:
+    def get_labels(self, ids: List[str]) -> Dict[str, str]:
         """
-        Get the label for a specific Wikidata property PID.
+        Get English labels for many Wikidata entities/properties at once.
+        
+        wbgetentities accepts up to 50 IDs per call, so the IDs are sent in
+        chunks of 50 instead of one request per ID. Malformed IDs are dropped
+        before batching, and a chunk the API rejects is split in half and
+        retried so one bad ID doesn't lose the labels of the others.
         
         Args:
-            pid: Wikidata PID (e.g., 'P27')
+            ids: Wikidata QIDs and/or PIDs (e.g., ['Q194057', 'P27'])
             
         Returns:
-            The label string if found, None otherwise
+            Dictionary mapping each ID to its label (IDs without a label are omitted)
         """
+        labels = {}
+        unique_ids = [i for i in dict.fromkeys(ids) if WIKIDATA_ID.match(i)]
+        
+        for start in range(0, len(unique_ids), WBGETENTITIES_BATCH_SIZE):
+            self._fetch_label_chunk(unique_ids[start:start + WBGETENTITIES_BATCH_SIZE], labels)
+        
+        return labels
+    
+    def _fetch_label_chunk(self, chunk: List[str], labels: Dict[str, str]):
+        """Add the English labels for one wbgetentities chunk to labels."""
         params = {
             'action': 'wbgetentities',
             'format': 'json',
-            'ids': pid,
+            'ids': '|'.join(chunk),
             'props': 'labels',
             'languages': 'en'
         }
         
         try:
-            response = self.session.get(self.api_url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            if 'entities' in data and pid in data['entities']:
-                entity = data['entities'][pid]
-                if 'labels' in entity and 'en' in entity['labels']:
-                    return entity['labels']['en']['value']
+            data = self._fetch_json(self.api_url, params, timeout=10)
+        except Exception as e:
+            print(f"Error getting labels for {', '.join(chunk)}: {e}")
+            return
+        
+        if 'error' in data:
+            # The API rejects the whole chunk for one bad ID; split it to
+            # isolate that ID and still label the rest
+            if len(chunk) > 1:
+                middle = len(chunk) // 2
+                self._fetch_label_chunk(chunk[:middle], labels)
+                self._fetch_label_chunk(chunk[middle:], labels)
+            else:
+                print(f"Error getting label for {chunk[0]}: {data['error'].get('info', data['error'])}")
+            return
+        
+        for entity_id, entity in data.get('entities', {}).items():
+            if 'labels' in entity and 'en' in entity['labels']:
+                labels[entity_id] = entity['labels']['en']['value']
+    
+    def get_entity_label(self, qid: str) -> Optional[str]:
+        """
+        Get the label for a specific Wikidata entity QID.
+        
+        Args:
+            qid: Wikidata QID (e.g., 'Q194057')
             
-            return None
+        Returns:
+            The label string if found, None otherwise
+        """
+        return self.get_labels([qid]).get(qid)
+    
+    def _get_property_label(self, pid: str) -> Optional[str]:
+        """
+        Get the label for a specific Wikidata property PID.
+        
+        Args:
+            pid: Wikidata PID (e.g., 'P27')
             
-        except Exception as e:
-            print(f"Error getting label for property {pid}: {e}")
-            return None
+        Returns:
+            The label string if found, None otherwise
+        """
+        return self.get_labels([pid]).get(pid)
     
     def find_relationships(self, subject_qid: str, object_qid: str) -> List[Dict]:
         """
@@ -138,13 +425,11 @@ class WikidataClient:
         """
         
         try:
-            response = self.session.get(
+            data = self._fetch_json(
                 self.sparql_url,
-                params={'query': query, 'format': 'json'},
+                {'query': query, 'format': 'json'},
                 timeout=15
             )
-            response.raise_for_status()
-            data = response.json()
             
             relationships = []
             if 'results' in data and 'bindings' in data['results']:
@@ -157,19 +442,26 @@ class WikidataClient:
                         property_uri = binding['property']['value']
                         property_id = property_uri.split('/')[-1]
                     
-                    # Get the label - if SERVICE returned it, use it; otherwise fetch separately
+                    # Get the label - if SERVICE returned it, use it; otherwise fetch it below
                     property_label = binding.get('propertyLabel', {}).get('value', None)
                     if not property_label or property_label.startswith('http'):
-                        # Label not available or is a URI, fetch it separately
-                        property_label = self._get_property_label(property_id)
-                        if not property_label:
-                            property_label = property_id
+                        property_label = None
                     
                     relationships.append({
                         'property_id': property_id,
                         'label': property_label
                     })
             
+            # Fetch all missing labels in one batched request
+            missing_pids = [r['property_id'] for r in relationships if r['label'] is None]
+            if missing_pids:
+                fetched_labels = self.get_labels(missing_pids)
+                for relationship in relationships:
+                    if relationship['label'] is None:
+                        relationship['label'] = fetched_labels.get(
+                            relationship['property_id'], relationship['property_id']
+                        )
+            
             return relationships
             
         except Exception as e:
@@ -187,13 +479,118 @@ class WikidataClient:
         Returns:
             Dictionary with the shortest relationship info, or None if no relationship found
         """
-        relationships = self.find_relationships(subject_qid, object_qid)
+        # Let the SPARQL endpoint pick the shortest label and return only that row
+        query = f"""
+        SELECT ?prop ?propLabel WHERE {{
+          wd:{subject_qid} ?property wd:{object_qid} .
+          ?prop wikibase:directClaim ?property .
+          SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en". }}
+        }}
+        ORDER BY STRLEN(?propLabel)
+        LIMIT 1
+        """
         
-        if not relationships:
+        try:
+            data = self._fetch_json(
+                self.sparql_url,
+                {'query': query, 'format': 'json'},
+                timeout=15
+            )
+            
+            bindings = data.get('results', {}).get('bindings', [])
+            if not bindings:
+                return None
+            
+            property_id = bindings[0]['prop']['value'].split('/')[-1]
+            property_label = bindings[0].get('propLabel', {}).get('value', None)
+            if not property_label or property_label.startswith('http'):
+                property_label = self._get_property_label(property_id) or property_id
+            
+            return {
+                'property_id': property_id,
+                'label': property_label
+            }
+            
+        except Exception as e:
+            print(f"Error finding shortest relationship between {subject_qid} and {object_qid}: {e}")
             return None
+    
+    def batch_get_shortest_relationships(self, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict]:
+        """
+        Find the shortest-label relationship for many entity pairs at once.
+        
+        All pairs of a batch are sent in a single SPARQL query using
+        VALUES (?s ?o), so one HTTP call covers up to SPARQL_PAIR_BATCH_SIZE
+        pairs instead of one query per pair.
+        
+        Args:
+            pairs: (subject_qid, object_qid) tuples
+            
+        Returns:
+            Dictionary mapping each pair that has a relationship to its
+            shortest relationship info (property ID and label)
+        """
+        shortest = {}
+        unique_pairs = list(dict.fromkeys(pairs))
+        
+        for start in range(0, len(unique_pairs), SPARQL_PAIR_BATCH_SIZE):
+            chunk = unique_pairs[start:start + SPARQL_PAIR_BATCH_SIZE]
+            
+            values = ' '.join(f"(wd:{subject_qid} wd:{object_qid})" for subject_qid, object_qid in chunk)
+            query = f"""
+            SELECT ?s ?o ?prop ?propLabel WHERE {{
+              VALUES (?s ?o) {{ {values} }}
+              ?s ?property ?o .
+              ?prop wikibase:directClaim ?property .
+              SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en". }}
+            }}
+            """
+            
+            try:
+                data = self._fetch_json(
+                    self.sparql_url,
+                    {'query': query, 'format': 'json'},
+                    timeout=30,
+                    method='POST'
+                )
+                
+                relationships_by_pair = {}
+                for binding in data.get('results', {}).get('bindings', []):
+                    pair = (binding['s']['value'].split('/')[-1], binding['o']['value'].split('/')[-1])
+                    
+                    property_label = binding.get('propLabel', {}).get('value', None)
+                    if not property_label or property_label.startswith('http'):
+                        property_label = None
+                    
+                    relationships_by_pair.setdefault(pair, []).append({
+                        'property_id': binding['prop']['value'].split('/')[-1],
+                        'label': property_label
+                    })
+                
+                # Fetch all missing labels in one batched request
+                missing_pids = [
+                    r['property_id']
+                    for relationships in relationships_by_pair.values()
+                    for r in relationships if r['label'] is None
+                ]
+                fetched_labels = self.get_labels(missing_pids) if missing_pids else {}
+                
+                for pair, relationships in relationships_by_pair.items():
+                    for relationship in relationships:
+                        if relationship['label'] is None:
+                            relationship['label'] = fetched_labels.get(
+                                relationship['property_id'], relationship['property_id']
+                            )
+                    shortest[pair] = min(relationships, key=lambda r: len(r['label']))
+                
+            except Exception as e:
+                # Fall back to one relationship query per pair for this batch
+                print(f"Error in batch relationship search, searching individually: {e}")
+                for subject_qid, object_qid in chunk:
+                    relationship = self.get_shortest_relationship(subject_qid, object_qid)
+                    if relationship:
+                        shortest[(subject_qid, object_qid)] = relationship
         
-        # Find the relationship with the shortest label
-        shortest = min(relationships, key=lambda r: len(r['label']))
         return shortest
     
     def enrich_entity(self, entity_text: str) -> Dict:
@@ -206,20 +603,7 @@ class WikidataClient:
         Returns:
             Dictionary with original text, QID, and Wikidata label
         """
-        result = {
-            'original_text': entity_text,
-            'qid': None,
-            'wikidata_label': None,
-            'description': None
-        }
-        
-        entity_info = self.search_entity(entity_text)
-        if entity_info:
-            result['qid'] = entity_info['qid']
-            result['wikidata_label'] = entity_info['label']
-            result['description'] = entity_info['description']
-        
-        return result
+        return _enriched_entity(entity_text, self.search_entity(entity_text))
     
     def enrich_relationship(self, subject_text: str, object_text: str, 
                            subject_qid: str, object_qid: str) -> Dict:
@@ -253,53 +637,132 @@ class WikidataClient:
         return result
 
 
+def _enriched_entity(entity_text: str, entity_info: Optional[Dict]) -> Dict:
+    """
+    Build the enriched entity dictionary from a search result (or None if not found).
+    """
+    result = {
+        'original_text': entity_text,
+        'qid': None,
+        'wikidata_label': None,
+        'description': None
+    }
+    
+    if entity_info:
+        result['qid'] = entity_info['qid']
+        result['wikidata_label'] = entity_info['label']
+        result['description'] = entity_info['description']
+    
+    return result
+
+
 def batch_enrich_entities(client: WikidataClient, entities: List[str], 
-                          delay: float = 0.5) -> List[Dict]:
+                          max_workers: int = DEFAULT_MAX_WORKERS) -> List[Dict]:
     """
     Enrich multiple entities with Wikidata information.
     
+    Entities are resolved in batched SPARQL searches (one query per
+    SPARQL_SEARCH_BATCH_SIZE entities), and the batches run concurrently on a
+    thread pool; the client's rate limiter keeps the combined request rate
+    within Wikidata's limits.
+    
     Args:
         client: WikidataClient instance
         entities: List of entity text strings
-        delay: Delay between requests to avoid rate limiting
+        max_workers: Number of concurrent batch queries
         
     Returns:
         List of enriched entity dictionaries
     """
-    enriched = []
-    for entity_text in entities:
-        enriched_entity = client.enrich_entity(entity_text)
-        enriched.append(enriched_entity)
-        time.sleep(delay)  # Rate limiting
+    # Look up each distinct entity only once
+    unique_entities = list(dict.fromkeys(entities))
+    batches = [
+        unique_entities[start:start + SPARQL_SEARCH_BATCH_SIZE]
+        for start in range(0, len(unique_entities), SPARQL_SEARCH_BATCH_SIZE)
+    ]
     
-    return enriched
+    matches = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for batch_matches in executor.map(client.batch_search_entities, batches):
+            matches.update(batch_matches)
+    
+    return [_enriched_entity(entity_text, matches.get(entity_text)) for entity_text in entities]
+
+
+def batch_shortest_relationships(client: WikidataClient, 
+                                 qid_pairs: List[Tuple[str, str]],
+                                 max_workers: int = DEFAULT_MAX_WORKERS) -> Dict[Tuple[str, str], Dict]:
+    """
+    Find the shortest-label relationship for many (subject_qid, object_qid) pairs.
+    
+    Pairs are resolved in batched SPARQL queries (one query per
+    SPARQL_PAIR_BATCH_SIZE pairs), and the batches run concurrently on a
+    thread pool; the client's rate limiter keeps the combined request rate
+    within Wikidata's limits.
+    
+    Args:
+        client: WikidataClient instance
+        qid_pairs: List of (subject_qid, object_qid) tuples
+        max_workers: Number of concurrent batch queries
+        
+    Returns:
+        Dictionary mapping each pair that has a relationship to its shortest
+        relationship info (property ID and label)
+    """
+    # Look up each distinct pair only once
+    unique_pairs = list(dict.fromkeys(qid_pairs))
+    batches = [
+        unique_pairs[start:start + SPARQL_PAIR_BATCH_SIZE]
+        for start in range(0, len(unique_pairs), SPARQL_PAIR_BATCH_SIZE)
+    ]
+    
+    shortest = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for batch_shortest in executor.map(client.batch_get_shortest_relationships, batches):
+            shortest.update(batch_shortest)
+    
+    return shortest
 
 
 def batch_enrich_relationships(client: WikidataClient, 
                                relationships: List[Tuple[str, str]], 
                                entity_qid_map: Dict[str, str],
-                               delay: float = 0.5) -> List[Dict]:
+                               max_workers: int = DEFAULT_MAX_WORKERS) -> List[Dict]:
     """
     Enrich multiple relationships with Wikidata information.
     
+    All (subject, object) pairs with known QIDs are looked up together with
+    batch_shortest_relationships instead of one SPARQL query per pair.
+    
     Args:
         client: WikidataClient instance
         relationships: List of (subject, object) tuples
         entity_qid_map: Mapping from entity text to QID
-        delay: Delay between requests to avoid rate limiting
+        max_workers: Number of concurrent batch queries
         
     Returns:
         List of enriched relationship dictionaries
     """
+    qid_pairs = [
+        (entity_qid_map[subject], entity_qid_map[obj])
+        for subject, obj in relationships
+        if entity_qid_map.get(subject) and entity_qid_map.get(obj)
+    ]
+    shortest = batch_shortest_relationships(client, qid_pairs, max_workers)
+    
     enriched = []
     for subject, obj in relationships:
         subject_qid = entity_qid_map.get(subject)
         object_qid = entity_qid_map.get(obj)
+        relationship = shortest.get((subject_qid, object_qid))
         
-        enriched_rel = client.enrich_relationship(
-            subject, obj, subject_qid, object_qid
-        )
-        enriched.append(enriched_rel)
-        time.sleep(delay)  # Rate limiting
+        enriched.append({
+            'subject': subject,
+            'object': obj,
+            'subject_qid': subject_qid,
+            'object_qid': object_qid,
+            'wikidata_property': relationship['property_id'] if relationship else None,
+            'wikidata_label': relationship['label'] if relationship else None
+        })
     
-    return enriched
\ No newline at end of file
+    return enriched
@@ -0,0 +1,43 @@
+import os
+import sys
+import unittest
+
+# The app modules import each other by bare name from src/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from entity_extractor import EntityExtractor
+
+
+def person(text):
+    return {'text': text, 'label': 'PERSON'}
+
+
+class MergePersonEntitiesTest(unittest.TestCase):
+    def setUp(self):
+        # Merging never touches the spaCy model, so skip loading it
+        self.extractor = EntityExtractor.__new__(EntityExtractor)
+    
+    def merged_texts(self, *names):
+        return [e['text'] for e in self.extractor._merge_person_entities([person(n) for n in names])]
+    
+    def test_shared_last_name_merges_into_longest(self):
+        self.assertEqual(self.merged_texts("Barack Obama", "Obama", "Michelle Obama"), ["Michelle Obama"])
+    
+    def test_name_inside_three_part_name(self):
+        self.assertEqual(self.merged_texts("Dillon", "Charles Dillon Stengel"), ["Charles Dillon Stengel"])
+        self.assertEqual(self.merged_texts("Ann", "Charles Ann Annabel"), ["Charles Ann Annabel"])
+    
+    def test_first_and_last_name_merge_into_full_name(self):
+        self.assertEqual(self.merged_texts("Casey Stengel", "Casey", "Stengel"), ["Casey Stengel"])
+    
+    def test_unrelated_names_stay_separate(self):
+        self.assertEqual(self.merged_texts("Barack Obama", "Casey Stengel"), ["Barack Obama", "Casey Stengel"])
+    
+    def test_other_labels_pass_through(self):
+        entities = [person("Obama"), person("Barack Obama"), {'text': 'Hawaii', 'label': 'GPE'}]
+        merged = self.extractor._merge_person_entities(entities)
+        self.assertEqual([e['text'] for e in merged], ["Barack Obama", "Hawaii"])
+
+
+if __name__ == '__main__':
+    unittest.main()
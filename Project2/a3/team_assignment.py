@@ -5,12 +5,53 @@ Assigns students to teams of 5-6 and matches them with projects based on prefere
 """
 
 import csv
-import re
+import os
+from operator import itemgetter
 from collections import defaultdict
-from typing import List, Dict, Set, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 import sys
 
 
+# Read buffer for the preferences CSV, so wide files are read in few syscalls
+INPUT_BUFFER_SIZE = 1 << 20
+
+# Write buffer for the output CSV, so rows are flushed in large blocks
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+def parse_preference_rank(pref_value: str) -> Optional[int]:
+    """
+    Return N from the first "#N" in a cell like "#1 Choice", or None.
+    
+    Plain string scanning is much cheaper than running a regex on every
+    student x project cell.
+    """
+    start = pref_value.find('#')
+    while start != -1:
+        end = start + 1
+        while end < len(pref_value) and pref_value[end].isdecimal():
+            end += 1
+        if end > start + 1:
+            return int(pref_value[start + 1:end])
+        start = pref_value.find('#', end)
+    return None
+
+
+def column_getter(indices: List[int]) -> Callable[[List[str]], Tuple[str, ...]]:
+    """
+    Return a function that extracts the given columns of a row as a tuple.
+    
+    Uses operator.itemgetter so each row is sliced in C; itemgetter returns a
+    bare value for a single index, so that case is wrapped to stay a tuple.
+    """
+    if not indices:
+        return lambda row: ()
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda row: (row[index],)
+    return itemgetter(*indices)
+
+
 class TeamAssignment:
     def __init__(self, csv_path: str):
         self.csv_path = csv_path
@@ -21,7 +62,11 @@ class TeamAssignment:
         
     def parse_csv(self):
         """Parse the CSV file to extract student preferences."""
-        with open(self.csv_path, 'r', encoding='utf-8') as f:
+        with open(self.csv_path, 'r', encoding='utf-8', buffering=INPUT_BUFFER_SIZE) as f:
+            # The file is read front to back once; let the kernel prefetch ahead (Linux only)
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            
             reader = csv.reader(f)
             headers = next(reader)
             
@@ -37,59 +82,73 @@ class TeamAssignment:
                 if i < 4:  # Skip timestamp, email, name, netid
                     continue
                 # If column header contains brackets, it's a project
-                if '[' in col and ']' in col:
-                    project_name = col.split('[')[1].split(']')[0]
+                # (find() the bracket positions instead of allocating split() lists)
+                left_bracket = col.find('[')
+                right_bracket = col.find(']', left_bracket + 1) if left_bracket != -1 else -1
+                if right_bracket != -1:
+                    project_name = col[left_bracket + 1:right_bracket]
                     project_cols.append((i, project_name))
                     self.projects.add(project_name)
                 # If column header contains "Team Member", it's a subteam column
                 elif 'Team Member' in col:
                     subteam_cols.append(i)
             
+            # Split the column layout once so each row is read column-by-column
+            # without per-cell bounds checks (short rows are padded instead)
+            project_col_indices = [col_idx for col_idx, _ in project_cols]
+            project_names = [project_name for _, project_name in project_cols]
+            row_width = max(project_col_indices + subteam_cols + [netid_idx]) + 1
+            get_pref_values = column_getter(project_col_indices)
+            get_member_values = column_getter(subteam_cols)
+            
             # Process each student
             for row in reader:
                 if len(row) <= netid_idx:
                     continue
                     
-                netid = row[netid_idx].strip()
+                # Netids are interned so the many dict/set lookups compare by identity first
+                netid = sys.intern(row[netid_idx].strip())
                 if not netid:
                     continue
+                
+                if len(row) < row_width:
+                    row.extend([''] * (row_width - len(row)))
                     
                 # Get project preferences
                 project_prefs = {}
-                for col_idx, project_name in project_cols:
-                    if col_idx < len(row):
-                        pref_value = row[col_idx]
-                        if pref_value and pref_value.strip():
-                            # Extract preference number from "#1 Choice", "#2 Choice", etc.
-                            match = re.search(r'#(\d+)', pref_value)
-                            if match:
-                                pref_rank = int(match.group(1))
-                                project_prefs[project_name] = pref_rank
+                for project_name, pref_value in zip(project_names, get_pref_values(row)):
+                    if pref_value and pref_value.strip():
+                        # Extract preference number from "#1 Choice", "#2 Choice", etc.
+                        pref_rank = parse_preference_rank(pref_value)
+                        if pref_rank is not None:
+                            project_prefs[project_name] = pref_rank
                 
                 # Get subteam members
                 subteam_members = set()
-                for col_idx in subteam_cols:
-                    if col_idx < len(row):
-                        member_value = row[col_idx]
-                        if member_value and member_value.strip():
-                            # Extract netid from entries like "Name, netid"
-                            member_str = member_value.strip()
-                            # Try different formats
-                            if ',' in member_str:
-                                parts = member_str.split(',')
-                                member_netid = parts[-1].strip()
-                            else:
-                                # Just the netid
-                                member_netid = member_str
-                            
-                            # Clean up the netid
-                            member_netid = member_netid.replace('@uw.edu', '').strip()
-                            if member_netid and member_netid != netid:
-                                subteam_members.add(member_netid)
+                for member_value in get_member_values(row):
+                    if member_value and member_value.strip():
+                        # Extract netid from entries like "Name, netid"
+                        member_str = member_value.strip()
+                        # Try different formats
+                        if ',' in member_str:
+                            parts = member_str.split(',')
+                            member_netid = parts[-1].strip()
+                        else:
+                            # Just the netid
+                            member_netid = member_str
+                        
+                        # Clean up the netid
+                        member_netid = sys.intern(member_netid.replace('@uw.edu', '').strip())
+                        if member_netid and member_netid != netid:
+                            subteam_members.add(member_netid)
                 
                 self.students[netid] = {
                     'netid': netid,
                     'projects': project_prefs,
+                    # (project, rank) pairs sorted best rank first, built once for assignment
+                    'ranked_projects': sorted(project_prefs.items(), key=itemgetter(1)),
+                    # Hashable copy of the preferences for subteam consistency checks
+                    'preference_signature': frozenset(project_prefs.items()),
                     'subteam_members': subteam_members
                 }
         
@@ -97,112 +156,140 @@ class TeamAssignment:
     
     def form_subteams(self):
         """Form subteams based on mutual preferences."""
-        visited = set()
-        
-        for netid in self.students:
-            if netid in visited:
-                continue
-            
-            # Find all students who mutually list each other
-            subteam = self._find_connected_subteam(netid, visited)
-            
-            if subteam:
-                # Verify project preferences are consistent
-                if self._verify_project_consistency(subteam):
-                    self.subteams.append(subteam)
-                    visited.update(subteam)
-                else:
-                    # If not consistent, treat each as individual
-                    print(f"Warning: Subteam {subteam} has inconsistent preferences, splitting")
-                    for student in subteam:
-                        self.subteams.append([student])
-                        visited.add(student)
+        # Each group of students who (transitively) mutually list each other
+        for subteam in self._find_mutual_subteams():
+            # Verify project preferences are consistent
+            if self._verify_project_consistency(subteam):
+                self.subteams.append(subteam)
+            else:
+                # If not consistent, treat each as individual
+                print(f"Warning: Subteam {subteam} has inconsistent preferences, splitting")
+                for student in subteam:
+                    self.subteams.append([student])
         
         print(f"Formed {len(self.subteams)} subteams")
         for i, subteam in enumerate(self.subteams):
             print(f"  Subteam {i+1}: {len(subteam)} members")
     
-    def _find_connected_subteam(self, start_netid: str, visited: Set[str]) -> List[str]:
-        """Find all mutually connected students forming a subteam."""
-        if start_netid in visited:
-            return []
+    def _find_mutual_subteams(self) -> List[List[str]]:
+        """
+        Find all groups of mutually connected students.
         
-        # Use BFS to find all connected members
-        subteam = {start_netid}
-        to_check = [start_netid]
+        Two students are connected when each lists the other as a subteam
+        member. Groups are built with a union-find (path compression + union
+        by rank) in a single pass over the listed members, instead of a
+        separate BFS per student. Students are numbered once so the union-find
+        state lives in flat parent/rank lists rather than netid-keyed dicts.
         
-        while to_check:
-            current = to_check.pop(0)
-            if current not in self.students:
-                continue
-                
-            # Get members this student wants
-            wanted_members = self.students[current]['subteam_members']
-            
-            for member in wanted_members:
-                if member in subteam or member in visited:
-                    continue
-                if member not in self.students:
-                    continue
-                
-                # Check if it's mutual
-                their_members = self.students[member]['subteam_members']
-                if current in their_members:
-                    subteam.add(member)
-                    to_check.append(member)
+        Returns: Groups in order of their first student, members in CSV order
+        """
+        netids = list(self.students)
+        index = {netid: i for i, netid in enumerate(netids)}
+        parent = list(range(len(netids)))
+        rank = [0] * len(netids)
+        
+        def find(i: int) -> int:
+            root = i
+            while parent[root] != root:
+                root = parent[root]
+            # Point every student on the path directly at the root
+            while parent[i] != root:
+                parent[i], i = root, parent[i]
+            return root
         
-        return list(subteam)
+        def union(i: int, j: int):
+            root1, root2 = find(i), find(j)
+            if root1 == root2:
+                return
+            if rank[root1] < rank[root2]:
+                root1, root2 = root2, root1
+            parent[root2] = root1
+            if rank[root1] == rank[root2]:
+                rank[root1] += 1
+        
+        for i, netid in enumerate(netids):
+            for member in self.students[netid]['subteam_members']:
+                j = index.get(member)
+                # Only mutual listings connect two students; each pair is seen
+                # from both sides, so handle it from the lower-numbered one
+                if j is not None and j > i and netid in self.students[member]['subteam_members']:
+                    union(i, j)
+        
+        groups = defaultdict(list)
+        for i, netid in enumerate(netids):
+            groups[find(i)].append(netid)
+        
+        return list(groups.values())
     
     def _verify_project_consistency(self, subteam: List[str]) -> bool:
         """Verify that all members have the same project preferences."""
         if len(subteam) <= 1:
             return True
         
-        # Get the first member's preferences
-        first_prefs = self.students[subteam[0]]['projects']
+        # Members agree when they all share one preference signature; the
+        # signatures' cached hashes reject most mismatches without a full compare
+        signatures = {self.students[netid]['preference_signature'] for netid in subteam}
+        return len(signatures) == 1
+    
+    def _pack_subteams(self, subteams: List[List[str]]) -> List[List[str]]:
+        """
+        Pack subteams of fewer than 5 members into teams using first-fit-decreasing.
+        
+        Subteams are placed largest first into the first team that still has
+        room for them (max 6);
+        otherwise they start a new team. Teams left under 5 members then take
+        single-student subteams from teams of 6, so no subteam is ever split.
+        
+        Returns: Packed teams (some may still have fewer than 5 members)
+        """
+        packed_teams = []     # members of each packed team
+        packed_subteams = []  # subteams packed into each team
         
-        # Check that all members have the same preferences
-        for netid in subteam[1:]:
-            if self.students[netid]['projects'] != first_prefs:
-                return False
+        for subteam in sorted(subteams, key=len, reverse=True):
+            for members, packed in zip(packed_teams, packed_subteams):
+                if len(members) + len(subteam) <= 6:
+                    members.extend(subteam)
+                    packed.append(subteam)
+                    break
+            else:
+                packed_teams.append(subteam[:])
+                packed_subteams.append([subteam])
+        
+        # Top up teams under 5 members with single students from the fullest teams
+        for members, packed in zip(packed_teams, packed_subteams):
+            donors = sorted(zip(packed_teams, packed_subteams), key=lambda donor: len(donor[0]), reverse=True)
+            for donor_members, donor_packed in donors:
+                if len(members) >= 5 or len(donor_members) <= 5:
+                    break
+                for single in [s for s in donor_packed if len(s) == 1]:
+                    if len(members) >= 5 or len(donor_members) <= 5:
+                        break
+                    donor_packed.remove(single)
+                    donor_members.remove(single[0])
+                    packed.append(single)
+                    members.extend(single)
         
-        return True
+        return packed_teams
     
     def form_teams(self):
         """Combine subteams into teams of 5-6 members."""
-        # Sort subteams by size (larger first)
-        sorted_subteams = sorted(self.subteams, key=len, reverse=True)
+        # Bucket subteams by size in one pass (CSV order is kept within a size)
+        subteams_by_size = defaultdict(list)
+        for subteam in self.subteams:
+            subteams_by_size[len(subteam)].append(subteam)
+        sizes = sorted(subteams_by_size, reverse=True)
         
         # Subteams of size 5-6 become teams immediately
-        for subteam in sorted_subteams[:]:
-            if 5 <= len(subteam) <= 6:
-                self.teams.append(subteam)
-                sorted_subteams.remove(subteam)
+        self.teams.extend(subteams_by_size[6])
+        self.teams.extend(subteams_by_size[5])
         
-        # Try to combine smaller subteams
-        used = set()
-        for i, subteam in enumerate(sorted_subteams):
-            if i in used:
-                continue
-            
-            current_team = subteam[:]
-            used.add(i)
-            
-            # Try to add more subteams to reach 5-6
-            for j, other_subteam in enumerate(sorted_subteams):
-                if j in used:
-                    continue
-                
-                new_size = len(current_team) + len(other_subteam)
-                if new_size <= 6:
-                    current_team.extend(other_subteam)
-                    used.add(j)
-                    if new_size >= 5:
-                        break
-            
-            # Add the team even if it's not perfect size
-            if current_team:
-                self.teams.append(current_team)
+        # Combine the other subteams (larger first) using first-fit-decreasing
+        # bin packing, adding each team even if it's not perfect size
+        other_subteams = [
+            subteam for size in sizes if not 5 <= size <= 6
+            for subteam in subteams_by_size[size]
+        ]
+        self.teams.extend(self._pack_subteams(other_subteams))
         
         print(f"Formed {len(self.teams)} teams")
         for i, team in enumerate(self.teams):
@@ -213,40 +300,34 @@ class TeamAssignment:
         project_assignments = []
         used_projects = defaultdict(int)
         
-        # Sort teams by size (larger teams with exact preferences first)
-        def team_priority(team):
+        # Sort teams by size (larger teams with exact preferences first);
+        # each team's priority and first member are computed once up front
+        keyed_teams = []
+        for team in self.teams:
             size = len(team)
             # Prioritize teams of exact size (5-6)
-            if 5 <= size <= 6:
-                return (0, -size)
-            else:
-                return (1, -size)
-        
-        sorted_teams = sorted(self.teams, key=team_priority)
+            priority = (0 if 5 <= size <= 6 else 1, -size)
+            keyed_teams.append((priority, team, team[0]))
+        keyed_teams.sort(key=itemgetter(0))
         
-        for team in sorted_teams:
+        for _, team, first_member in keyed_teams:
             # Get the first member's preferences (should be same for subteam)
-            first_member = team[0]
-            prefs = self.students[first_member]['projects']
+            ranked_projects = self.students[first_member]['ranked_projects']
             
-            # Try to assign best available project
+            # Try to assign best available project, walking the pre-sorted ranks 1-5
             assigned_project = None
-            for pref_rank in range(1, 6):
-                # Find projects with this rank
-                for project, rank in prefs.items():
-                    if rank == pref_rank:
-                        # Check availability (limit reuse)
-                        if used_projects[project] < 2:  # Allow some reuse if needed
-                            assigned_project = project
-                            used_projects[project] += 1
-                            break
-                
-                if assigned_project:
+            for project, rank in ranked_projects:
+                if rank > 5:
+                    break
+                # Check availability (limit reuse)
+                if rank >= 1 and used_projects[project] < 2:  # Allow some reuse if needed
+                    assigned_project = project
+                    used_projects[project] += 1
                     break
             
             # If no project found, assign the first preference anyway
-            if not assigned_project and prefs:
-                assigned_project = min(prefs.items(), key=lambda x: x[1])[0]
+            if not assigned_project and ranked_projects:
+                assigned_project = ranked_projects[0][0]
                 used_projects[assigned_project] += 1
             
             if assigned_project:
@@ -261,8 +342,6 @@ class TeamAssignment:
     
     def save_output(self, assignments: List[Tuple[str, List[str]]], output_path: str):
         """Save the assignments to a CSV file."""
-        import os
-        
         # Create directory if it doesn't exist
         output_dir = os.path.dirname(output_path)
         if output_dir and not os.path.exists(output_dir):
@@ -272,11 +351,10 @@ class TeamAssignment:
                 # If we can't create /workspace, use current directory
                 output_path = 'out.csv'
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
             writer = csv.writer(f)
-            for project, team in assignments:
-                team_str = str(team)
-                writer.writerow([project, team_str])
+            # Team column is the Python list string, e.g. "['m1', 'm2', ...]"
+            writer.writerows((project, str(team)) for project, team in assignments)
         print(f"Saved output to {output_path}")
     
     def run(self, output_path: str):
@@ -4,16 +4,83 @@ Test Runner for Team Assignment System (A4)
 Generates test cases and validates the team assignment algorithm.
 """
 
+import ast
+import contextlib
 import csv
+import io
+import multiprocessing
 import os
 import sys
 import re
 from typing import List, Dict, Tuple
 import subprocess
+from collections import Counter, defaultdict
+from functools import lru_cache
+
+# Make team_assignments importable from any working directory, adding the
+# script's directory to sys.path only once.
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPT_DIR)
+
+from team_assignments import TeamAssignment, column_getter
+
+# Preference cell text for the common ranks, built once instead of per cell
+RANK_STR = {i: f'#{i} Choice' for i in range(1, 6)}
+
+# Rank number in a preference cell such as "#2 Choice"
+_RANK_RE = re.compile(r'#(\d+)')
+
+# Brackets, quotes and whitespace removed from a team list string that isn't
+# a valid Python literal
+_TEAM_CLEAN = re.compile(r"[\[\]'\"\s]")
+
+# Write buffer for generated test CSVs
+CSV_BUFFER_SIZE = 1 << 20
+
+# Set once the testing/ directories exist, so they're only created once per run
+_DIRS_READY = False
+
+
+@lru_cache(maxsize=None)
+def _header_line(projects: Tuple[str, ...]) -> str:
+    """Survey CSV header for a project list, joined once per list.
+    
+    Column names never need quoting, so this is written straight to the file
+    with the csv module's default \r\n terminator instead of through writerow.
+    """
+    columns = ['Timestamp', 'Email', 'Name', 'NetID']
+    columns += [f'Project Preferences [{proj}]' for proj in projects]
+    columns += [f'Team Member {i}' for i in range(1, 6)]
+    return ','.join(columns) + '\r\n'
+
+
+@lru_cache(maxsize=256)
+def _parse_output_cached(output_path: str, mtime_ns: int) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """Parse an output CSV into immutable (project, team) pairs"""
+    with open(output_path, 'r', newline='') as f:
+        # One comprehension over the reader instead of an append per row
+        return tuple(
+            (row[0], _parse_team(row[1]))
+            for row in csv.reader(f)
+            if len(row) >= 2
+        )
+
+
+def _parse_team(team_str: str) -> Tuple[str, ...]:
+    """Parse a team column written as a Python list string, e.g. "['a', 'b']" """
+    try:
+        return tuple(ast.literal_eval(team_str))
+    except (ValueError, SyntaxError, TypeError):
+        # Not a valid literal, fall back to dropping brackets, quotes and
+        # whitespace in one regex pass before splitting
+        return tuple(_TEAM_CLEAN.sub('', team_str).split(','))
 
 
 class TestCase:
     """Base class for test cases"""
+    __slots__ = ('name', 'description', 'motivation', 'csv_path', 'output_path',
+                 'expected', 'observed', 'passed')
     def __init__(self, name: str, description: str, motivation: str):
         self.name = name
         self.description = description
@@ -24,6 +91,66 @@ class TestCase:
         self.observed = None
         self.passed = None
         
+    @staticmethod
+    def _student_row(netid: str, subteam_members: List[str], prefs: Dict[str, int],
+                     project_index: Dict[str, int]) -> List[str]:
+        """Build one survey row: student info, a rank per project, and 5 subteam columns"""
+        # Start from a blank row of the final width and fill only the ranked
+        # projects and listed members, rather than scanning every project
+        num_projects = len(project_index)
+        row = ['2024-01-01', f'{netid}@uw.edu', f'Test Student {netid}', netid] + [''] * (num_projects + 5)
+        for proj, rank in prefs.items():
+            col = project_index.get(proj)
+            if col is not None:
+                # Ranks past the cached table (scenarios with 6+ projects) are formatted on demand
+                row[4 + col] = RANK_STR.get(rank) or f'#{rank} Choice'
+        members = subteam_members[:5]
+        member_start = 4 + num_projects
+        row[member_start:member_start + len(members)] = members
+        return row
+    
+    @staticmethod
+    def _expand_subteams(subteams: List[Tuple[List[str], Dict[str, int]]]) -> List[Tuple[str, List[str], Dict[str, int]]]:
+        """Expand ([members], prefs) subteams into (netid, subteam_members, prefs) rows"""
+        return [
+            (netid, members[:i] + members[i + 1:], prefs)
+            for members, prefs in subteams
+            for i, netid in enumerate(members)
+        ]
+    
+    @staticmethod
+    def _group_by_project(members, member_locations: Dict[str, str]) -> Dict[str, List[str]]:
+        """Group the given members by the project they were assigned to, skipping unassigned ones"""
+        # Sort so the printed member lists don't depend on per-process string hashing
+        locations = {}
+        for member in sorted(members):
+            project = member_locations.get(member)
+            if project is not None:
+                locations.setdefault(project, []).append(member)
+        return locations
+    
+    def _write_students_csv(self, students: List[Tuple[str, List[str], Dict[str, int]]],
+                            projects: List[str]):
+        """Write the header and one row per student to csv_path in a single write"""
+        project_index = {proj: i for i, proj in enumerate(projects)}
+        buf = io.StringIO()
+        buf.write(_header_line(tuple(projects)))
+        csv.writer(buf).writerows(
+            self._student_row(netid, subteam_members, prefs, project_index)
+            for netid, subteam_members, prefs in students
+        )
+        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
+            f.write(buf.getvalue())
+    
+    @classmethod
+    def _ensure_dirs(cls):
+        """Create the test data and results directories once per run"""
+        global _DIRS_READY
+        if not _DIRS_READY:
+            os.makedirs("testing/test_data", exist_ok=True)
+            os.makedirs("testing/test_results", exist_ok=True)
+            _DIRS_READY = True
+        
     def generate_csv(self):
         """Generate test CSV file - to be overridden by specific tests"""
         raise NotImplementedError
@@ -49,10 +176,6 @@ class TestCase:
         # Run team assignment
         print("\nRunning team assignment...")
         try:
-            # Import and run the team assignment
-            sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-            from team_assignments import TeamAssignment
-            
             assigner = TeamAssignment(self.csv_path)
             assigner.run(self.output_path)
             
@@ -95,19 +218,9 @@ class TestCase:
     # make this fit with what guorui expects our output to be
     def _parse_output(self, output_path: str) -> List[Tuple[str, List[str]]]:
         """Parse the output CSV file"""
-        assignments = []
-        with open(output_path, 'r') as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if len(row) >= 2:
-                    project = row[0]
-                    # Parse the team list string
-                    team_str = row[1]
-                    # Remove brackets and quotes, split by comma
-                    team_str = team_str.strip("[]'\"")
-                    team = [m.strip().strip("'\"") for m in team_str.split(',')]
-                    assignments.append((project, team))
-        return assignments
+        # Cached per (path, mtime), so a rewritten file is parsed again
+        parsed = _parse_output_cached(output_path, os.stat(output_path).st_mtime_ns)
+        return [(project, list(team)) for project, team in parsed]
 
 ### START OF TEST CASES HERE
 
@@ -132,6 +245,12 @@ class TeamSizeValidationTest(TestCase):
         - How does it handle combining small subteams?
         - Are any students left in undersized teams?
     """
+    __slots__ = ()
+    # Project columns (we'll use simple project names)
+    PROJECTS = ('ProjectA', 'ProjectB', 'ProjectC', 'ProjectD', 'ProjectE',
+                'ProjectF', 'ProjectG', 'ProjectH', 'ProjectI', 'ProjectJ',
+                'ProjectK', 'ProjectL', 'ProjectM', 'ProjectN', 'ProjectO',
+                'ProjectP', 'ProjectQ', 'ProjectR')
     
     def __init__(self):
         super().__init__(
@@ -144,97 +263,45 @@ class TeamSizeValidationTest(TestCase):
     def generate_csv(self):
         """Generate test CSV with various subteam sizes"""
         # Create directories
-        os.makedirs("testing/test_data", exist_ok=True)
+        self._ensure_dirs()
         
-        # define test data
-        # format: (netid, subteam_members, project_preferences)
-        students = [
+        # define test data once per subteam; each member lists the others
+        # format: ([members], project_preferences)
+        subteams = [
             # Subteam 1: 2 people (should need to combine)
-            ("student01", ["student02"], {"ProjectA": 1, "ProjectB": 2, "ProjectC": 3, "ProjectD": 4, "ProjectE": 5}),
-            ("student02", ["student01"], {"ProjectA": 1, "ProjectB": 2, "ProjectC": 3, "ProjectD": 4, "ProjectE": 5}),
+            (["student01", "student02"], {"ProjectA": 1, "ProjectB": 2, "ProjectC": 3, "ProjectD": 4, "ProjectE": 5}),
             
             # Subteam 2: 2 people (should need to combine)
-            ("student03", ["student04"], {"ProjectB": 1, "ProjectA": 2, "ProjectC": 3, "ProjectD": 4, "ProjectE": 5}),
-            ("student04", ["student03"], {"ProjectB": 1, "ProjectA": 2, "ProjectC": 3, "ProjectD": 4, "ProjectE": 5}),
+            (["student03", "student04"], {"ProjectB": 1, "ProjectA": 2, "ProjectC": 3, "ProjectD": 4, "ProjectE": 5}),
             
             # Subteam 3: 2 people (should need to combine)
-            ("student05", ["student06"], {"ProjectC": 1, "ProjectA": 2, "ProjectB": 3, "ProjectD": 4, "ProjectE": 5}),
-            ("student06", ["student05"], {"ProjectC": 1, "ProjectA": 2, "ProjectB": 3, "ProjectD": 4, "ProjectE": 5}),
+            (["student05", "student06"], {"ProjectC": 1, "ProjectA": 2, "ProjectB": 3, "ProjectD": 4, "ProjectE": 5}),
             
             # Subteam 4: 3 people (should need to combine with 2-3 person subteam)
-            ("student07", ["student08", "student09"], {"ProjectD": 1, "ProjectA": 2, "ProjectB": 3, "ProjectC": 4, "ProjectE": 5}),
-            ("student08", ["student07", "student09"], {"ProjectD": 1, "ProjectA": 2, "ProjectB": 3, "ProjectC": 4, "ProjectE": 5}),
-            ("student09", ["student07", "student08"], {"ProjectD": 1, "ProjectA": 2, "ProjectB": 3, "ProjectC": 4, "ProjectE": 5}),
+            (["student07", "student08", "student09"], {"ProjectD": 1, "ProjectA": 2, "ProjectB": 3, "ProjectC": 4, "ProjectE": 5}),
             
             # Subteam 5: 3 people (should combine with subteam 4 to make 6)
-            ("student10", ["student11", "student12"], {"ProjectE": 1, "ProjectA": 2, "ProjectB": 3, "ProjectC": 4, "ProjectD": 5}),
-            ("student11", ["student10", "student12"], {"ProjectE": 1, "ProjectA": 2, "ProjectB": 3, "ProjectC": 4, "ProjectD": 5}),
-            ("student12", ["student10", "student11"], {"ProjectE": 1, "ProjectA": 2, "ProjectB": 3, "ProjectC": 4, "ProjectD": 5}),
+            (["student10", "student11", "student12"], {"ProjectE": 1, "ProjectA": 2, "ProjectB": 3, "ProjectC": 4, "ProjectD": 5}),
             
             # Subteam 6: 4 people (should combine with 1-2 person subteam)
-            ("student13", ["student14", "student15", "student16"], {"ProjectF": 1, "ProjectA": 2, "ProjectB": 3, "ProjectC": 4, "ProjectD": 5}),
-            ("student14", ["student13", "student15", "student16"], {"ProjectF": 1, "ProjectA": 2, "ProjectB": 3, "ProjectC": 4, "ProjectD": 5}),
-            ("student15", ["student13", "student14", "student16"], {"ProjectF": 1, "ProjectA": 2, "ProjectB": 3, "ProjectC": 4, "ProjectD": 5}),
-            ("student16", ["student13", "student14", "student15"], {"ProjectF": 1, "ProjectA": 2, "ProjectB": 3, "ProjectC": 4, "ProjectD": 5}),
+            (["student13", "student14", "student15", "student16"], {"ProjectF": 1, "ProjectA": 2, "ProjectB": 3, "ProjectC": 4, "ProjectD": 5}),
             
             # Individual students (no subteam preferences, should be combined)
-            ("student17", [], {"ProjectG": 1, "ProjectA": 2, "ProjectB": 3, "ProjectC": 4, "ProjectD": 5}),
-            ("student18", [], {"ProjectH": 1, "ProjectA": 2, "ProjectB": 3, "ProjectC": 4, "ProjectD": 5}),
+            (["student17"], {"ProjectG": 1, "ProjectA": 2, "ProjectB": 3, "ProjectC": 4, "ProjectD": 5}),
+            (["student18"], {"ProjectH": 1, "ProjectA": 2, "ProjectB": 3, "ProjectC": 4, "ProjectD": 5}),
             
             # Subteam 7: 5 people (perfect size, should become a team immediately)
-            ("student19", ["student20", "student21", "student22", "student23"], {"ProjectI": 1, "ProjectJ": 2, "ProjectK": 3, "ProjectL": 4, "ProjectM": 5}),
-            ("student20", ["student19", "student21", "student22", "student23"], {"ProjectI": 1, "ProjectJ": 2, "ProjectK": 3, "ProjectL": 4, "ProjectM": 5}),
-            ("student21", ["student19", "student20", "student22", "student23"], {"ProjectI": 1, "ProjectJ": 2, "ProjectK": 3, "ProjectL": 4, "ProjectM": 5}),
-            ("student22", ["student19", "student20", "student21", "student23"], {"ProjectI": 1, "ProjectJ": 2, "ProjectK": 3, "ProjectL": 4, "ProjectM": 5}),
-            ("student23", ["student19", "student20", "student21", "student22"], {"ProjectI": 1, "ProjectJ": 2, "ProjectK": 3, "ProjectL": 4, "ProjectM": 5}),
+            (["student19", "student20", "student21", "student22", "student23"],
+             {"ProjectI": 1, "ProjectJ": 2, "ProjectK": 3, "ProjectL": 4, "ProjectM": 5}),
             
             # Subteam 8: 6 people (perfect size, should become a team immediately)
-            ("student24", ["student25", "student26", "student27", "student28", "student29"], {"ProjectN": 1, "ProjectO": 2, "ProjectP": 3, "ProjectQ": 4, "ProjectR": 5}),
-            ("student25", ["student24", "student26", "student27", "student28", "student29"], {"ProjectN": 1, "ProjectO": 2, "ProjectP": 3, "ProjectQ": 4, "ProjectR": 5}),
-            ("student26", ["student24", "student25", "student27", "student28", "student29"], {"ProjectN": 1, "ProjectO": 2, "ProjectP": 3, "ProjectQ": 4, "ProjectR": 5}),
-            ("student27", ["student24", "student25", "student26", "student28", "student29"], {"ProjectN": 1, "ProjectO": 2, "ProjectP": 3, "ProjectQ": 4, "ProjectR": 5}),
-            ("student28", ["student24", "student25", "student26", "student27", "student29"], {"ProjectN": 1, "ProjectO": 2, "ProjectP": 3, "ProjectQ": 4, "ProjectR": 5}),
-            ("student29", ["student24", "student25", "student26", "student27", "student28"], {"ProjectN": 1, "ProjectO": 2, "ProjectP": 3, "ProjectQ": 4, "ProjectR": 5}),
+            (["student24", "student25", "student26", "student27", "student28", "student29"],
+             {"ProjectN": 1, "ProjectO": 2, "ProjectP": 3, "ProjectQ": 4, "ProjectR": 5}),
         ]
+        students = self._expand_subteams(subteams)
         
         # write CSV to easy visualize results
-        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Write header
-            header = ['Timestamp', 'Email', 'Name', 'NetID']
-            # Add project columns (we'll use simple project names)
-            projects = ['ProjectA', 'ProjectB', 'ProjectC', 'ProjectD', 'ProjectE', 
-                       'ProjectF', 'ProjectG', 'ProjectH', 'ProjectI', 'ProjectJ',
-                       'ProjectK', 'ProjectL', 'ProjectM', 'ProjectN', 'ProjectO',
-                       'ProjectP', 'ProjectQ', 'ProjectR']
-            for proj in projects:
-                header.append(f'Project Preferences [{proj}]')
-            # Add subteam member columns
-            for i in range(1, 6):
-                header.append(f'Team Member {i}')
-            writer.writerow(header)
-            
-            # Write student rows
-            for netid, subteam_members, prefs in students:
-                row = ['2024-01-01', f'{netid}@uw.edu', f'Test Student {netid}', netid]
-                
-                # Add project preferences
-                for proj in projects:
-                    if proj in prefs:
-                        rank = prefs[proj]
-                        row.append(f'#{rank} Choice')
-                    else:
-                        row.append('')
-                
-                # Add subteam members
-                for i in range(5):
-                    if i < len(subteam_members):
-                        row.append(subteam_members[i])
-                    else:
-                        row.append('')
-                
-                writer.writerow(row)
+        self._write_students_csv(students, self.PROJECTS)
         
         print(f"   Generated {len(students)} students in various subteam configurations")
     
@@ -286,6 +353,8 @@ class SubteamIntegrityTest(TestCase):
     - Are subteams kept together during team formation?
     - Are non-mutual preferences handled correctly (not treated as subteam)?
     """
+    __slots__ = ('known_subteams',)
+    PROJECTS = ('ProjectX', 'ProjectY', 'ProjectZ', 'ProjectW', 'ProjectV')
     
     def __init__(self):
         super().__init__(
@@ -303,33 +372,26 @@ class SubteamIntegrityTest(TestCase):
         
     def generate_csv(self):
         """Generate test CSV with clearly defined subteams"""
-        os.makedirs("testing/test_data", exist_ok=True)
+        self._ensure_dirs()
         
-        # Define test data
-        # Format: (netid, subteam_members, project_preferences)
-        students = [
+        # Define mutual subteams once; each member lists the others
+        # Format: ([members], project_preferences)
+        subteams = [
             # Subteam ABC: 3 people who all list each other (MUTUAL)
-            ("studentA", ["studentB", "studentC"], 
-             {"ProjectX": 1, "ProjectY": 2, "ProjectZ": 3, "ProjectW": 4, "ProjectV": 5}),
-            ("studentB", ["studentA", "studentC"], 
-             {"ProjectX": 1, "ProjectY": 2, "ProjectZ": 3, "ProjectW": 4, "ProjectV": 5}),
-            ("studentC", ["studentA", "studentB"], 
+            (["studentA", "studentB", "studentC"], 
              {"ProjectX": 1, "ProjectY": 2, "ProjectZ": 3, "ProjectW": 4, "ProjectV": 5}),
             
             # Subteam DE: 2 people who list each other (MUTUAL)
-            ("studentD", ["studentE"], 
-             {"ProjectY": 1, "ProjectX": 2, "ProjectZ": 3, "ProjectW": 4, "ProjectV": 5}),
-            ("studentE", ["studentD"], 
+            (["studentD", "studentE"], 
              {"ProjectY": 1, "ProjectX": 2, "ProjectZ": 3, "ProjectW": 4, "ProjectV": 5}),
             
             # Subteam FGH: 3 people who all list each other (MUTUAL)
-            ("studentF", ["studentG", "studentH"], 
-             {"ProjectZ": 1, "ProjectX": 2, "ProjectY": 3, "ProjectW": 4, "ProjectV": 5}),
-            ("studentG", ["studentF", "studentH"], 
+            (["studentF", "studentG", "studentH"], 
              {"ProjectZ": 1, "ProjectX": 2, "ProjectY": 3, "ProjectW": 4, "ProjectV": 5}),
-            ("studentH", ["studentF", "studentG"], 
-             {"ProjectZ": 1, "ProjectX": 2, "ProjectY": 3, "ProjectW": 4, "ProjectV": 5}),
-            
+        ]
+        
+        # Format: (netid, subteam_members, project_preferences)
+        students = self._expand_subteams(subteams) + [
             # Non-mutual case: M lists N, but N doesn't list M (should NOT be subteam)
             ("studentM", ["studentN"], 
              {"ProjectW": 1, "ProjectX": 2, "ProjectY": 3, "ProjectZ": 4, "ProjectV": 5}),
@@ -350,38 +412,7 @@ class SubteamIntegrityTest(TestCase):
         ]
         
         # Write CSV
-        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Write header
-            header = ['Timestamp', 'Email', 'Name', 'NetID']
-            projects = ['ProjectX', 'ProjectY', 'ProjectZ', 'ProjectW', 'ProjectV']
-            for proj in projects:
-                header.append(f'Project Preferences [{proj}]')
-            for i in range(1, 6):
-                header.append(f'Team Member {i}')
-            writer.writerow(header)
-            
-            # Write student rows
-            for netid, subteam_members, prefs in students:
-                row = ['2024-01-01', f'{netid}@uw.edu', f'Test Student {netid}', netid]
-                
-                # Add project preferences
-                for proj in projects:
-                    if proj in prefs:
-                        rank = prefs[proj]
-                        row.append(f'#{rank} Choice')
-                    else:
-                        row.append('')
-                
-                # Add subteam members
-                for i in range(5):
-                    if i < len(subteam_members):
-                        row.append(subteam_members[i])
-                    else:
-                        row.append('')
-                
-                writer.writerow(row)
+        self._write_students_csv(students, self.PROJECTS)
         
         print(f"   Generated {len(students)} students with 3 defined subteams")
         print(f"   - Subteam ABC (3 members): studentA, studentB, studentC")
@@ -396,17 +427,18 @@ class SubteamIntegrityTest(TestCase):
         
         violations = []
         
+        # Index every assigned member to their team's project in one pass
+        member_to_team = {member: project for project, team in assignments for member in team}
+        
         # Check each known subteam
         for subteam_name, subteam_members in self.known_subteams.items():
             # Find which team(s) contain members of this subteam
             teams_containing_members = {}
             
-            for project, team in assignments:
-                team_set = set(team)
-                members_in_this_team = subteam_members.intersection(team_set)
-                
-                if members_in_this_team:
-                    teams_containing_members[project] = members_in_this_team
+            for member in subteam_members:
+                project = member_to_team.get(member)
+                if project is not None:
+                    teams_containing_members.setdefault(project, set()).add(member)
             
             # All subteam members should be on exactly ONE team
             if len(teams_containing_members) == 0:
@@ -440,14 +472,8 @@ class SubteamIntegrityTest(TestCase):
         # Check that non-mutual preferences are NOT treated as subteam
         # StudentM lists StudentN, but N doesn't list M
         # They should NOT necessarily be on same team
-        studentM_team = None
-        studentN_team = None
-        
-        for project, team in assignments:
-            if 'studentM' in team:
-                studentM_team = project
-            if 'studentN' in team:
-                studentN_team = project
+        studentM_team = member_to_team.get('studentM')
+        studentN_team = member_to_team.get('studentN')
         
         non_mutual_note = ""
         if studentM_team == studentN_team:
@@ -492,6 +518,7 @@ class ProjectPreferenceValidityTest(TestCase):
     - Is there proper validation before project assignment?
     - What happens when no project satisfies all members?
     """
+    __slots__ = ('team_preferences',)
     
     def __init__(self):
         super().__init__(
@@ -505,7 +532,7 @@ class ProjectPreferenceValidityTest(TestCase):
         
     def generate_csv(self):
         """Generate test CSV with various project preference scenarios"""
-        os.makedirs("testing/test_data", exist_ok=True)
+        self._ensure_dirs()
         
         # Define test data with specific project preference patterns
         students = [
@@ -589,45 +616,11 @@ class ProjectPreferenceValidityTest(TestCase):
             # Team 5 will be formed from individuals, harder to predict
         }
         
+        # Collect all unique projects
+        all_projects = tuple(sorted({proj for _, _, prefs in students for proj in prefs}))
+        
         # Write CSV
-        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Write header
-            header = ['Timestamp', 'Email', 'Name', 'NetID']
-            
-            # Collect all unique projects
-            all_projects = set()
-            for _, _, prefs in students:
-                all_projects.update(prefs.keys())
-            all_projects = sorted(all_projects)
-            
-            for proj in all_projects:
-                header.append(f'Project Preferences [{proj}]')
-            for i in range(1, 6):
-                header.append(f'Team Member {i}')
-            writer.writerow(header)
-            
-            # Write student rows
-            for netid, subteam_members, prefs in students:
-                row = ['2024-01-01', f'{netid}@uw.edu', f'Test Student {netid}', netid]
-                
-                # Add project preferences
-                for proj in all_projects:
-                    if proj in prefs:
-                        rank = prefs[proj]
-                        row.append(f'#{rank} Choice')
-                    else:
-                        row.append('')
-                
-                # Add subteam members
-                for i in range(5):
-                    if i < len(subteam_members):
-                        row.append(subteam_members[i])
-                    else:
-                        row.append('')
-                
-                writer.writerow(row)
+        self._write_students_csv(students, all_projects)
         
         print(f"   Generated {len(students)} students in 5 teams")
         print(f"   - Team 1 (5 members): All prefer ProjectAlpha #1")
@@ -646,22 +639,30 @@ class ProjectPreferenceValidityTest(TestCase):
         # Need to load student preferences from the test CSV
         student_prefs = self._load_student_preferences()
         
+        # Each student's top 5 projects, so membership is a single set lookup
+        top5_by_student = {
+            member: {proj for proj, rank in prefs.items() if rank <= 5}
+            for member, prefs in student_prefs.items()
+        }
+        
         for project, team in assignments:
             # Check if this project is in ALL team members' top 5
             members_without_project = []
             members_with_project = []
             
             for member in team:
-                if member in student_prefs:
-                    prefs = student_prefs[member]
-                    if project in prefs and prefs[project] <= 5:
-                        members_with_project.append((member, prefs[project]))
+                top5 = top5_by_student.get(member)
+                if top5 is None:
+                    continue
+                prefs = student_prefs[member]
+                if project in top5:
+                    members_with_project.append((member, prefs[project]))
+                else:
+                    # Project NOT in this member's top 5!
+                    if project in prefs:
+                        members_without_project.append(f"{member} (has {project} as #{prefs[project]} - not in top 5)")
                     else:
-                        # Project NOT in this member's top 5!
-                        if project in prefs:
-                            members_without_project.append(f"{member} (has {project} as #{prefs[project]} - not in top 5)")
-                        else:
-                            members_without_project.append(f"{member} (doesn't have {project} at all)")
+                        members_without_project.append(f"{member} (doesn't have {project} at all)")
             
             if members_without_project:
                 # VIOLATION: Some members don't have this project in top 5
@@ -703,12 +704,18 @@ class ProjectPreferenceValidityTest(TestCase):
             netid_idx = 3
             project_cols = []
             
-            for i, col in enumerate(headers):
-                if i < 4:
-                    continue
-                if '[' in col and ']' in col:
-                    project_name = col.split('[')[1].split(']')[0]
-                    project_cols.append((i, project_name))
+            for i, col in enumerate(headers[4:], 4):
+                # Slice out the bracketed name by position, without splitting
+                start = col.find('[')
+                end = col.find(']', start + 1)
+                if start != -1 and end != -1:
+                    project_cols.append((i, col[start + 1:end]))
+            
+            # Pull every project cell out of a row in one call; short rows are
+            # padded to the header width first
+            project_names = [project_name for _, project_name in project_cols]
+            get_pref_values = column_getter([i for i, _ in project_cols])
+            row_width = len(headers)
             
             # Read student preferences
             for row in reader:
@@ -719,15 +726,15 @@ class ProjectPreferenceValidityTest(TestCase):
                 if not netid:
                     continue
                 
+                if len(row) < row_width:
+                    row += [''] * (row_width - len(row))
+                
                 prefs = {}
-                for col_idx, project_name in project_cols:
-                    if col_idx < len(row):
-                        pref_value = row[col_idx]
-                        if pref_value and pref_value.strip():
-                            match = re.search(r'#(\d+)', pref_value)
-                            if match:
-                                pref_rank = int(match.group(1))
-                                prefs[project_name] = pref_rank
+                for project_name, pref_value in zip(project_names, get_pref_values(row)):
+                    # Empty and blank cells never match
+                    match = _RANK_RE.search(pref_value)
+                    if match:
+                        prefs[project_name] = int(match.group(1))
                 
                 student_prefs[netid] = prefs
         
@@ -754,6 +761,9 @@ class SubteamPreferenceConsistencyTest(TestCase):
     - Are inconsistent subteams properly split?
     - Does _verify_project_consistency() work correctly?
     """
+    __slots__ = ('expected_intact_subteams', 'expected_split_subteams')
+    PROJECTS = ('ProjectA', 'ProjectB', 'ProjectC', 'ProjectD', 'ProjectE',
+                'ProjectF', 'ProjectG', 'ProjectH', 'ProjectI', 'ProjectJ')
     
     def __init__(self):
         super().__init__(
@@ -768,7 +778,7 @@ class SubteamPreferenceConsistencyTest(TestCase):
         
     def generate_csv(self):
         """Generate test CSV with various consistency scenarios"""
-        os.makedirs("testing/test_data", exist_ok=True)
+        self._ensure_dirs()
         
         # Define test data
         students = [
@@ -813,39 +823,7 @@ class SubteamPreferenceConsistencyTest(TestCase):
         ]
         
         # Write CSV
-        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Write header
-            header = ['Timestamp', 'Email', 'Name', 'NetID']
-            projects = ['ProjectA', 'ProjectB', 'ProjectC', 'ProjectD', 'ProjectE',
-                       'ProjectF', 'ProjectG', 'ProjectH', 'ProjectI', 'ProjectJ']
-            for proj in projects:
-                header.append(f'Project Preferences [{proj}]')
-            for i in range(1, 6):
-                header.append(f'Team Member {i}')
-            writer.writerow(header)
-            
-            # Write student rows
-            for netid, subteam_members, prefs in students:
-                row = ['2024-01-01', f'{netid}@uw.edu', f'Test Student {netid}', netid]
-                
-                # Add project preferences
-                for proj in projects:
-                    if proj in prefs:
-                        rank = prefs[proj]
-                        row.append(f'#{rank} Choice')
-                    else:
-                        row.append('')
-                
-                # Add subteam members
-                for i in range(5):
-                    if i < len(subteam_members):
-                        row.append(subteam_members[i])
-                    else:
-                        row.append('')
-                
-                writer.writerow(row)
+        self._write_students_csv(students, self.PROJECTS)
         
         print(f"   Generated {len(students)} students with consistency test cases:")
         print(f"   - CASE 1: 3 members with identical rankings (should stay together)")
@@ -866,35 +844,32 @@ class SubteamPreferenceConsistencyTest(TestCase):
         inconsistent_proj_members = {'inconsistent_proj1', 'inconsistent_proj2'}
         
         # Find where each member ended up
-        member_locations = {}
-        for project, team in assignments:
-            for member in team:
-                member_locations[member] = project
+        member_locations = {member: project for project, team in assignments for member in team}
         
         results = []
         violations = []
         
         # Check consistent teams (should be together)
-        consistent1_teams = set([member_locations.get(m) for m in consistent_team_members if m in member_locations])
+        consistent1_teams = {member_locations[m] for m in consistent_team_members if m in member_locations}
         if len(consistent1_teams) == 1:
             results.append("✓ Consistent Team 1 (identical rankings): Stayed together")
         else:
             violations.append(f"Consistent Team 1 was SPLIT across teams: {consistent1_teams}")
         
-        consistent2_teams = set([member_locations.get(m) for m in consistent_team2_members if m in member_locations])
+        consistent2_teams = {member_locations[m] for m in consistent_team2_members if m in member_locations}
         if len(consistent2_teams) == 1:
             results.append("✓ Consistent Team 2 (identical rankings): Stayed together")
         else:
             violations.append(f"Consistent Team 2 was SPLIT across teams: {consistent2_teams}")
         
         # Check inconsistent teams (should be split)
-        inconsistent_rank_teams = set([member_locations.get(m) for m in inconsistent_rank_members if m in member_locations])
+        inconsistent_rank_teams = {member_locations[m] for m in inconsistent_rank_members if m in member_locations}
         if len(inconsistent_rank_teams) > 1:
             results.append(f"✓ Inconsistent Rank Team (different rankings): Correctly SPLIT across {len(inconsistent_rank_teams)} teams")
         else:
             violations.append(f"Inconsistent Rank Team should have been SPLIT but stayed together on {inconsistent_rank_teams}")
         
-        inconsistent_proj_teams = set([member_locations.get(m) for m in inconsistent_proj_members if m in member_locations])
+        inconsistent_proj_teams = {member_locations[m] for m in inconsistent_proj_members if m in member_locations}
         if len(inconsistent_proj_teams) > 1:
             results.append(f"✓ Inconsistent Project Team (different projects): Correctly SPLIT across {len(inconsistent_proj_teams)} teams")
         else:
@@ -938,6 +913,7 @@ class PreferenceDistributionAnalysisTest(TestCase):
     - What's the distribution of assigned ranks?
     - Are #4 and #5 assignments minimized?
     """
+    __slots__ = ('preference_distribution', 'student_preferences')
     
     def __init__(self):
         super().__init__(
@@ -952,28 +928,21 @@ class PreferenceDistributionAnalysisTest(TestCase):
         
     def generate_csv(self):
         """Generate realistic test CSV with varied preference patterns"""
-        os.makedirs("testing/test_data", exist_ok=True)
+        self._ensure_dirs()
         
         # Create 30 students (6 teams of 5) with realistic preference patterns
         # Some will have overlapping #1 choices (competition)
         # Some will have unique #1 choices (easy to satisfy)
-        students = []
-        
-        # Team 1: All want ProjectAlpha #1 (high competition)
-        for i in range(1, 6):
-            students.append((
-                f"team1_s{i}",
-                [f"team1_s{j}" for j in range(1, 6) if j != i],
-                {"ProjectAlpha": 1, "ProjectBeta": 2, "ProjectGamma": 3, "ProjectDelta": 4, "ProjectEpsilon": 5}
-            ))
-        
-        # Team 2: All want ProjectBeta #1 (high competition)
-        for i in range(1, 6):
-            students.append((
-                f"team2_s{i}",
-                [f"team2_s{j}" for j in range(1, 6) if j != i],
-                {"ProjectBeta": 1, "ProjectAlpha": 2, "ProjectGamma": 3, "ProjectDelta": 4, "ProjectEpsilon": 5}
-            ))
+        # Uniform teams are declared once and expanded per member
+        students = self._expand_subteams([
+            # Team 1: All want ProjectAlpha #1 (high competition)
+            ([f"team1_s{j}" for j in range(1, 6)],
+             {"ProjectAlpha": 1, "ProjectBeta": 2, "ProjectGamma": 3, "ProjectDelta": 4, "ProjectEpsilon": 5}),
+            
+            # Team 2: All want ProjectBeta #1 (high competition)
+            ([f"team2_s{j}" for j in range(1, 6)],
+             {"ProjectBeta": 1, "ProjectAlpha": 2, "ProjectGamma": 3, "ProjectDelta": 4, "ProjectEpsilon": 5}),
+        ])
         
         # Team 3: Diverse rankings, ProjectGamma is common
         students.extend([
@@ -989,73 +958,30 @@ class PreferenceDistributionAnalysisTest(TestCase):
              {"ProjectGamma": 1, "ProjectDelta": 2, "ProjectEpsilon": 3, "ProjectZeta": 4, "ProjectEta": 5}),
         ])
         
-        # Team 4: All want ProjectZeta #1 (easy - unique project)
-        for i in range(1, 6):
-            students.append((
-                f"team4_s{i}",
-                [f"team4_s{j}" for j in range(1, 6) if j != i],
-                {"ProjectZeta": 1, "ProjectEta": 2, "ProjectTheta": 3, "ProjectIota": 4, "ProjectKappa": 5}
-            ))
-        
-        # Team 5: All want ProjectEta #1
-        for i in range(1, 6):
-            students.append((
-                f"team5_s{i}",
-                [f"team5_s{j}" for j in range(1, 6) if j != i],
-                {"ProjectEta": 1, "ProjectTheta": 2, "ProjectIota": 3, "ProjectKappa": 4, "ProjectLambda": 5}
-            ))
-        
-        # Team 6: All want ProjectTheta #1
-        for i in range(1, 6):
-            students.append((
-                f"team6_s{i}",
-                [f"team6_s{j}" for j in range(1, 6) if j != i],
-                {"ProjectTheta": 1, "ProjectIota": 2, "ProjectKappa": 3, "ProjectLambda": 4, "ProjectMu": 5}
-            ))
+        students += self._expand_subteams([
+            # Team 4: All want ProjectZeta #1 (easy - unique project)
+            ([f"team4_s{j}" for j in range(1, 6)],
+             {"ProjectZeta": 1, "ProjectEta": 2, "ProjectTheta": 3, "ProjectIota": 4, "ProjectKappa": 5}),
+            
+            # Team 5: All want ProjectEta #1
+            ([f"team5_s{j}" for j in range(1, 6)],
+             {"ProjectEta": 1, "ProjectTheta": 2, "ProjectIota": 3, "ProjectKappa": 4, "ProjectLambda": 5}),
+            
+            # Team 6: All want ProjectTheta #1
+            ([f"team6_s{j}" for j in range(1, 6)],
+             {"ProjectTheta": 1, "ProjectIota": 2, "ProjectKappa": 3, "ProjectLambda": 4, "ProjectMu": 5}),
+        ])
         
-        # Store preferences for later analysis
+        # Store preferences for later analysis and collect all projects in
+        # the same pass
+        all_projects = set()
         for netid, _, prefs in students:
             self.student_preferences[netid] = prefs
+            all_projects.update(prefs)
+        all_projects = tuple(sorted(all_projects))
         
         # Write CSV
-        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Write header
-            header = ['Timestamp', 'Email', 'Name', 'NetID']
-            
-            # Collect all projects
-            all_projects = set()
-            for _, _, prefs in students:
-                all_projects.update(prefs.keys())
-            all_projects = sorted(all_projects)
-            
-            for proj in all_projects:
-                header.append(f'Project Preferences [{proj}]')
-            for i in range(1, 6):
-                header.append(f'Team Member {i}')
-            writer.writerow(header)
-            
-            # Write student rows
-            for netid, subteam_members, prefs in students:
-                row = ['2024-01-01', f'{netid}@uw.edu', f'Test Student {netid}', netid]
-                
-                # Add project preferences
-                for proj in all_projects:
-                    if proj in prefs:
-                        rank = prefs[proj]
-                        row.append(f'#{rank} Choice')
-                    else:
-                        row.append('')
-                
-                # Add subteam members
-                for i in range(5):
-                    if i < len(subteam_members):
-                        row.append(subteam_members[i])
-                    else:
-                        row.append('')
-                
-                writer.writerow(row)
+        self._write_students_csv(students, all_projects)
         
         print(f"   Generated {len(students)} students (6 teams of 5) with varied preferences:")
         print(f"   - Team 1: All want ProjectAlpha #1 (competition)")
@@ -1070,7 +996,6 @@ class PreferenceDistributionAnalysisTest(TestCase):
         self.expected = "Most students get #1 or #2, few get #4 or #5"
         
         # Calculate what rank each student got
-        rank_distribution = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
         unranked_students = []
         rank_details = []
         
@@ -1080,20 +1005,22 @@ class PreferenceDistributionAnalysisTest(TestCase):
             for student in team:
                 total_students += 1
                 
-                if student not in self.student_preferences:
+                # One .get per level instead of a membership test plus a subscript
+                prefs = self.student_preferences.get(student)
+                if prefs is None:
                     unranked_students.append(student)
                     continue
                 
-                prefs = self.student_preferences[student]
-                
-                if project in prefs:
-                    rank = prefs[project]
-                    rank_distribution[rank] += 1
+                rank = prefs.get(project)
+                if rank is not None:
                     rank_details.append((student, project, rank))
                 else:
                     # Project not in student's preferences at all!
                     unranked_students.append(f"{student} (got {project} - not in preferences!)")
         
+        # Count ranks in one pass; ranks nobody got read as 0
+        rank_distribution = Counter(rank for _, _, rank in rank_details)
+        
         # Calculate metrics
         total_ranked = sum(rank_distribution.values())
         avg_rank = sum(rank * count for rank, count in rank_distribution.items()) / total_ranked if total_ranked > 0 else 0
@@ -1180,6 +1107,17 @@ class ProjectReuseTest(TestCase):
     - When does project reuse occur and is it justified?
     - Are there scenarios where reuse indicates a problem?
     """
+    __slots__ = ('project_usage', 'reuse_scenarios')
+    PROJECTS = ('ProjectA', 'ProjectB', 'ProjectC', 'ProjectD', 'ProjectE', 'ProjectF')
+    # Expected #1 project for each subteam's member-name prefix, in the order
+    # mixed teams are classified
+    EXPECTED_PROJECTS = (
+        ('reuse_team1', 'ProjectA'), ('reuse_team2', 'ProjectA'),
+        ('reuse_team3', 'ProjectB'), ('reuse_team4', 'ProjectB'),
+        ('reuse_team5', 'ProjectC'), ('reuse_team6', 'ProjectC'),
+        ('restrictive_team', 'ProjectD'),  # Should prefer ProjectD over ProjectE
+        ('restrictive2_team', 'ProjectE'),
+    )
     
     def __init__(self):
         super().__init__(
@@ -1194,112 +1132,52 @@ class ProjectReuseTest(TestCase):
         
     def generate_csv(self):
         """Generate test CSV that forces project reuse scenarios"""
-        os.makedirs("testing/test_data", exist_ok=True)
+        self._ensure_dirs()
         
         # SCENARIO 1: More teams than projects (6 teams, only 3 projects)
         # This should force reuse
-        students = []
-        
-        # Team 1 (5 members): All want ProjectA #1
-        for i in range(1, 6):
-            students.append((
-                f"reuse_team1_m{i}",
-                [f"reuse_team1_m{j}" for j in range(1, 6) if j != i],
-                {"ProjectA": 1, "ProjectB": 2, "ProjectC": 3}
-            ))
-        
-        # Team 2 (6 members): All want ProjectA #1 (COMPETITION!)
-        for i in range(1, 7):
-            students.append((
-                f"reuse_team2_m{i}",
-                [f"reuse_team2_m{j}" for j in range(1, 7) if j != i],
-                {"ProjectA": 1, "ProjectB": 2, "ProjectC": 3}
-            ))
-        
-        # Team 3 (5 members): All want ProjectB #1
-        for i in range(1, 6):
-            students.append((
-                f"reuse_team3_m{i}",
-                [f"reuse_team3_m{j}" for j in range(1, 6) if j != i],
-                {"ProjectB": 1, "ProjectA": 2, "ProjectC": 3}
-            ))
-        
-        # Team 4 (6 members): All want ProjectB #1 (COMPETITION!)
-        for i in range(1, 7):
-            students.append((
-                f"reuse_team4_m{i}",
-                [f"reuse_team4_m{j}" for j in range(1, 7) if j != i],
-                {"ProjectB": 1, "ProjectA": 2, "ProjectC": 3}
-            ))
-        
-        # Team 5 (5 members): All want ProjectC #1
-        for i in range(1, 6):
-            students.append((
-                f"reuse_team5_m{i}",
-                [f"reuse_team5_m{j}" for j in range(1, 6) if j != i],
-                {"ProjectC": 1, "ProjectA": 2, "ProjectB": 3}
-            ))
-        
-        # Team 6 (6 members): All want ProjectC #1 (COMPETITION!)
-        for i in range(1, 7):
-            students.append((
-                f"reuse_team6_m{i}",
-                [f"reuse_team6_m{j}" for j in range(1, 7) if j != i],
-                {"ProjectC": 1, "ProjectA": 2, "ProjectB": 3}
-            ))
+        # Mutual subteams are declared once and expanded per member
+        students = self._expand_subteams([
+            # Team 1 (5 members): All want ProjectA #1
+            ([f"reuse_team1_m{j}" for j in range(1, 6)],
+             {"ProjectA": 1, "ProjectB": 2, "ProjectC": 3}),
+            
+            # Team 2 (6 members): All want ProjectA #1 (COMPETITION!)
+            ([f"reuse_team2_m{j}" for j in range(1, 7)],
+             {"ProjectA": 1, "ProjectB": 2, "ProjectC": 3}),
+            
+            # Team 3 (5 members): All want ProjectB #1
+            ([f"reuse_team3_m{j}" for j in range(1, 6)],
+             {"ProjectB": 1, "ProjectA": 2, "ProjectC": 3}),
+            
+            # Team 4 (6 members): All want ProjectB #1 (COMPETITION!)
+            ([f"reuse_team4_m{j}" for j in range(1, 7)],
+             {"ProjectB": 1, "ProjectA": 2, "ProjectC": 3}),
+            
+            # Team 5 (5 members): All want ProjectC #1
+            ([f"reuse_team5_m{j}" for j in range(1, 6)],
+             {"ProjectC": 1, "ProjectA": 2, "ProjectB": 3}),
+            
+            # Team 6 (6 members): All want ProjectC #1 (COMPETITION!)
+            ([f"reuse_team6_m{j}" for j in range(1, 7)],
+             {"ProjectC": 1, "ProjectA": 2, "ProjectB": 3}),
+        ])
         
         # SCENARIO 2: Teams with limited overlapping preferences
         # These teams can only work together on very few projects
         
-        # Team 7 (5 members): Very restrictive preferences
-        for i in range(1, 6):
-            students.append((
-                f"restrictive_team_m{i}",
-                [f"restrictive_team_m{j}" for j in range(1, 6) if j != i],
-                {"ProjectD": 1, "ProjectE": 2}  # Only 2 projects in top 5!
-            ))
-        
-        # Team 8 (5 members): Different restrictive preferences
-        for i in range(1, 6):
-            students.append((
-                f"restrictive2_team_m{i}",
-                [f"restrictive2_team_m{j}" for j in range(1, 6) if j != i],
-                {"ProjectE": 1, "ProjectF": 2}  # Only 2 projects, overlapping with Team 7 on ProjectE
-            ))
+        students += self._expand_subteams([
+            # Team 7 (5 members): Very restrictive preferences
+            ([f"restrictive_team_m{j}" for j in range(1, 6)],
+             {"ProjectD": 1, "ProjectE": 2}),  # Only 2 projects in top 5!
+            
+            # Team 8 (5 members): Different restrictive preferences
+            ([f"restrictive2_team_m{j}" for j in range(1, 6)],
+             {"ProjectE": 1, "ProjectF": 2}),  # Only 2 projects, overlapping with Team 7 on ProjectE
+        ])
         
         # Write CSV
-        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Write header
-            header = ['Timestamp', 'Email', 'Name', 'NetID']
-            projects = ['ProjectA', 'ProjectB', 'ProjectC', 'ProjectD', 'ProjectE', 'ProjectF']
-            for proj in projects:
-                header.append(f'Project Preferences [{proj}]')
-            for i in range(1, 6):
-                header.append(f'Team Member {i}')
-            writer.writerow(header)
-            
-            # Write student rows
-            for netid, subteam_members, prefs in students:
-                row = ['2024-01-01', f'{netid}@uw.edu', f'Test Student {netid}', netid]
-                
-                # Add project preferences
-                for proj in projects:
-                    if proj in prefs:
-                        rank = prefs[proj]
-                        row.append(f'#{rank} Choice')
-                    else:
-                        row.append('')
-                
-                # Add subteam members
-                for i in range(5):
-                    if i < len(subteam_members):
-                        row.append(subteam_members[i])
-                    else:
-                        row.append('')
-                
-                writer.writerow(row)
+        self._write_students_csv(students, self.PROJECTS)
         
         print(f"   Generated {len(students)} students in project reuse scenarios:")
         print(f"   - 6 teams competing for 3 projects (should force reuse)")
@@ -1312,12 +1190,10 @@ class ProjectReuseTest(TestCase):
         self.expected = "Project reuse should occur when necessary, not due to algorithm flaws"
         
         # Count project usage
-        project_usage = {}
+        project_usage = defaultdict(list)
         team_preferences = {}
         
         for project, team in assignments:
-            if project not in project_usage:
-                project_usage[project] = []
             project_usage[project].append(team)
             
             # Store team info for analysis
@@ -1362,27 +1238,25 @@ class ProjectReuseTest(TestCase):
         
         # Check if teams got their preferred projects
         preference_analysis = []
+        unexpected_assignments = 0
         for team_tuple, assigned_project in team_preferences.items():
             team = list(team_tuple)
             # For this test, we know teams should get their #1 choice if available
             expected_project = None
             
-            # Determine expected project based on team naming
-            if any('team1' in member or 'team2' in member for member in team):
-                expected_project = "ProjectA"
-            elif any('team3' in member or 'team4' in member for member in team):
-                expected_project = "ProjectB"
-            elif any('team5' in member or 'team6' in member for member in team):
-                expected_project = "ProjectC"
-            elif any('restrictive_team' in member for member in team):
-                expected_project = "ProjectD"  # Should prefer ProjectD over ProjectE
-            elif any('restrictive2_team' in member for member in team):
-                expected_project = "ProjectE"
+            # Determine expected project based on team naming: collect the
+            # members' name prefixes once, then take the first known prefix
+            prefixes = {member.rsplit('_m', 1)[0] for member in team}
+            for prefix, project in self.EXPECTED_PROJECTS:
+                if prefix in prefixes:
+                    expected_project = project
+                    break
             
             if expected_project and assigned_project == expected_project:
                 preference_analysis.append(f"   ✓ {assigned_project}: Team got expected #1 choice")
             elif expected_project:
                 preference_analysis.append(f"   ⚠️ {assigned_project}: Team wanted {expected_project} but got {assigned_project}")
+                unexpected_assignments += 1
             else:
                 preference_analysis.append(f"   ? {assigned_project}: Unknown team preference")
         
@@ -1403,8 +1277,7 @@ class ProjectReuseTest(TestCase):
         if reuse_ratio > 0.8:  # More than 80% of projects are reused
             issues.append(f"Very high reuse ratio: {reuse_ratio:.1%} of projects reused")
         
-        # Count teams that didn't get their expected project
-        unexpected_assignments = sum(1 for line in preference_analysis if "⚠️" in line)
+        # Teams that didn't get their expected project were counted above
         if unexpected_assignments > total_teams * 0.5:  # More than 50% unexpected
             issues.append(f"Many teams didn't get expected projects ({unexpected_assignments}/{total_teams})")
         
@@ -1439,6 +1312,12 @@ class LargeSubteamTest(TestCase):
     - Are large subteams split intelligently?
     - Are students still grouped with their preferred teammates when possible?
     """
+    __slots__ = ('expected_splits',)
+    PROJECTS = ('ProjectAlpha', 'ProjectBeta', 'ProjectGamma', 'ProjectDelta', 'ProjectEpsilon')
+    LARGE_TEAM_7_MEMBERS = frozenset(f"large7_m{i}" for i in range(1, 8))
+    LARGE_TEAM_8_MEMBERS = frozenset(f"large8_m{i}" for i in range(1, 9))
+    NORMAL_TEAM_5_MEMBERS = frozenset(f"normal5_m{i}" for i in range(1, 6))
+    NORMAL_TEAM_6_MEMBERS = frozenset(f"normal6_m{i}" for i in range(1, 7))
     
     def __init__(self):
         super().__init__(
@@ -1455,92 +1334,35 @@ class LargeSubteamTest(TestCase):
         
     def generate_csv(self):
         """Generate test CSV with oversized subteams"""
-        os.makedirs("testing/test_data", exist_ok=True)
-        
-        students = []
+        self._ensure_dirs()
         
-        # LARGE SUBTEAM 1: 7 members (should split into 5+2 or 6+1)
-        large_team_7 = [f"large7_m{i}" for i in range(1, 8)]
-        for i in range(1, 8):
-            subteam_members = [member for member in large_team_7 if member != f"large7_m{i}"]
-            students.append((
-                f"large7_m{i}",
-                subteam_members,
-                {"ProjectAlpha": 1, "ProjectBeta": 2, "ProjectGamma": 3, "ProjectDelta": 4, "ProjectEpsilon": 5}
-            ))
-        
-        # LARGE SUBTEAM 2: 8 members (should split into 6+2 or 5+3)
-        large_team_8 = [f"large8_m{i}" for i in range(1, 9)]
-        for i in range(1, 9):
-            subteam_members = [member for member in large_team_8 if member != f"large8_m{i}"]
-            students.append((
-                f"large8_m{i}",
-                subteam_members,
-                {"ProjectBeta": 1, "ProjectAlpha": 2, "ProjectGamma": 3, "ProjectDelta": 4, "ProjectEpsilon": 5}
-            ))
-        
-        # NORMAL SUBTEAMS for comparison
-        # Subteam of 5 (perfect size)
-        normal_team_5 = [f"normal5_m{i}" for i in range(1, 6)]
-        for i in range(1, 6):
-            subteam_members = [member for member in normal_team_5 if member != f"normal5_m{i}"]
-            students.append((
-                f"normal5_m{i}",
-                subteam_members,
-                {"ProjectGamma": 1, "ProjectAlpha": 2, "ProjectBeta": 3, "ProjectDelta": 4, "ProjectEpsilon": 5}
-            ))
-        
-        # Subteam of 6 (perfect size)
-        normal_team_6 = [f"normal6_m{i}" for i in range(1, 7)]
-        for i in range(1, 7):
-            subteam_members = [member for member in normal_team_6 if member != f"normal6_m{i}"]
-            students.append((
-                f"normal6_m{i}",
-                subteam_members,
-                {"ProjectDelta": 1, "ProjectAlpha": 2, "ProjectBeta": 3, "ProjectGamma": 4, "ProjectEpsilon": 5}
-            ))
+        # Mutual subteams are declared once and expanded per member
+        students = self._expand_subteams([
+            # LARGE SUBTEAM 1: 7 members (should split into 5+2 or 6+1)
+            ([f"large7_m{j}" for j in range(1, 8)],
+             {"ProjectAlpha": 1, "ProjectBeta": 2, "ProjectGamma": 3, "ProjectDelta": 4, "ProjectEpsilon": 5}),
+            
+            # LARGE SUBTEAM 2: 8 members (should split into 6+2 or 5+3)
+            ([f"large8_m{j}" for j in range(1, 9)],
+             {"ProjectBeta": 1, "ProjectAlpha": 2, "ProjectGamma": 3, "ProjectDelta": 4, "ProjectEpsilon": 5}),
+            
+            # NORMAL SUBTEAMS for comparison
+            # Subteam of 5 (perfect size)
+            ([f"normal5_m{j}" for j in range(1, 6)],
+             {"ProjectGamma": 1, "ProjectAlpha": 2, "ProjectBeta": 3, "ProjectDelta": 4, "ProjectEpsilon": 5}),
+            
+            # Subteam of 6 (perfect size)
+            ([f"normal6_m{j}" for j in range(1, 7)],
+             {"ProjectDelta": 1, "ProjectAlpha": 2, "ProjectBeta": 3, "ProjectGamma": 4, "ProjectEpsilon": 5}),
+        ])
         
         # INDIVIDUAL students to fill out teams
+        prefs = {"ProjectEpsilon": 1, "ProjectAlpha": 2, "ProjectBeta": 3, "ProjectGamma": 4, "ProjectDelta": 5}
         for i in range(1, 6):
-            students.append((
-                f"individual_m{i}",
-                [],
-                {"ProjectEpsilon": 1, "ProjectAlpha": 2, "ProjectBeta": 3, "ProjectGamma": 4, "ProjectDelta": 5}
-            ))
+            students.append((f"individual_m{i}", [], prefs))
         
         # Write CSV
-        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Write header
-            header = ['Timestamp', 'Email', 'Name', 'NetID']
-            projects = ['ProjectAlpha', 'ProjectBeta', 'ProjectGamma', 'ProjectDelta', 'ProjectEpsilon']
-            for proj in projects:
-                header.append(f'Project Preferences [{proj}]')
-            for i in range(1, 6):
-                header.append(f'Team Member {i}')
-            writer.writerow(header)
-            
-            # Write student rows
-            for netid, subteam_members, prefs in students:
-                row = ['2024-01-01', f'{netid}@uw.edu', f'Test Student {netid}', netid]
-                
-                # Add project preferences
-                for proj in projects:
-                    if proj in prefs:
-                        rank = prefs[proj]
-                        row.append(f'#{rank} Choice')
-                    else:
-                        row.append('')
-                
-                # Add subteam members
-                for i in range(5):
-                    if i < len(subteam_members):
-                        row.append(subteam_members[i])
-                    else:
-                        row.append('')
-                
-                writer.writerow(row)
+        self._write_students_csv(students, self.PROJECTS)
         
         print(f"   Generated {len(students)} students with oversized subteams:")
         print(f"   - Large subteam 1: 7 members (should split)")
@@ -1554,28 +1376,19 @@ class LargeSubteamTest(TestCase):
         self.expected = "Large subteams should be split into valid-sized teams while preserving connections"
         
         # Analyze how large subteams were handled
-        large_team_7_members = {f"large7_m{i}" for i in range(1, 8)}
-        large_team_8_members = {f"large8_m{i}" for i in range(1, 9)}
-        normal_team_5_members = {f"normal5_m{i}" for i in range(1, 6)}
-        normal_team_6_members = {f"normal6_m{i}" for i in range(1, 7)}
+        large_team_7_members = self.LARGE_TEAM_7_MEMBERS
+        large_team_8_members = self.LARGE_TEAM_8_MEMBERS
+        normal_team_5_members = self.NORMAL_TEAM_5_MEMBERS
+        normal_team_6_members = self.NORMAL_TEAM_6_MEMBERS
         
         # Find where each member ended up
-        member_locations = {}
-        for project, team in assignments:
-            for member in team:
-                member_locations[member] = project
+        member_locations = {member: project for project, team in assignments for member in team}
         
         analysis_parts = []
         violations = []
         
         # Check large subteam 7 (7 members)
-        large7_locations = {}
-        for member in large_team_7_members:
-            if member in member_locations:
-                project = member_locations[member]
-                if project not in large7_locations:
-                    large7_locations[project] = []
-                large7_locations[project].append(member)
+        large7_locations = self._group_by_project(large_team_7_members, member_locations)
         
         if large7_locations:
             analysis_parts.append(f"Large subteam 7 (7 members) split into {len(large7_locations)} team(s):")
@@ -1599,13 +1412,7 @@ class LargeSubteamTest(TestCase):
             violations.append("Large subteam 7 members not found in any team!")
         
         # Check large subteam 8 (8 members)
-        large8_locations = {}
-        for member in large_team_8_members:
-            if member in member_locations:
-                project = member_locations[member]
-                if project not in large8_locations:
-                    large8_locations[project] = []
-                large8_locations[project].append(member)
+        large8_locations = self._group_by_project(large_team_8_members, member_locations)
         
         if large8_locations:
             analysis_parts.append(f"\nLarge subteam 8 (8 members) split into {len(large8_locations)} team(s):")
@@ -1629,13 +1436,7 @@ class LargeSubteamTest(TestCase):
             violations.append("Large subteam 8 members not found in any team!")
         
         # Check normal subteams (should stay together)
-        normal5_locations = {}
-        for member in normal_team_5_members:
-            if member in member_locations:
-                project = member_locations[member]
-                if project not in normal5_locations:
-                    normal5_locations[project] = []
-                normal5_locations[project].append(member)
+        normal5_locations = self._group_by_project(normal_team_5_members, member_locations)
         
         if normal5_locations:
             analysis_parts.append(f"\nNormal subteam 5 (5 members):")
@@ -1644,13 +1445,7 @@ class LargeSubteamTest(TestCase):
             else:
                 violations.append(f"Normal subteam 5 was split across {len(normal5_locations)} teams!")
         
-        normal6_locations = {}
-        for member in normal_team_6_members:
-            if member in member_locations:
-                project = member_locations[member]
-                if project not in normal6_locations:
-                    normal6_locations[project] = []
-                normal6_locations[project].append(member)
+        normal6_locations = self._group_by_project(normal_team_6_members, member_locations)
         
         if normal6_locations:
             analysis_parts.append(f"\nNormal subteam 6 (6 members):")
@@ -1697,6 +1492,17 @@ class NoMutualPreferencesTest(TestCase):
     - Are students with one-sided preferences treated as individuals?
     - Does the BFS correctly handle non-mutual connections?
     """
+    __slots__ = ()
+    PROJECTS = ('ProjectAlpha', 'ProjectBeta', 'ProjectGamma', 'ProjectDelta', 'ProjectEpsilon')
+    
+    # Track expected outcomes
+    EXPECTED_INDIVIDUALS = frozenset({
+        'one_way_A', 'one_way_B',  # A lists B, but B doesn't list A
+        'circular_A', 'circular_B', 'circular_C',  # A→B→C→A but not mutual
+    })
+    EXPECTED_SUBTEAMS = frozenset({
+        'mutual_D', 'mutual_E',  # D and E list each other
+    })
     
     def __init__(self):
         super().__init__(
@@ -1705,18 +1511,9 @@ class NoMutualPreferencesTest(TestCase):
             motivation="Verify algorithm correctly identifies mutual vs non-mutual preferences"
         )
         
-        # Track expected outcomes
-        self.expected_individuals = {
-            'one_way_A', 'one_way_B',  # A lists B, but B doesn't list A
-            'circular_A', 'circular_B', 'circular_C',  # A→B→C→A but not mutual
-        }
-        self.expected_subteams = {
-            'mutual_D', 'mutual_E',  # D and E list each other
-        }
-        
     def generate_csv(self):
         """Generate test CSV with non-mutual preference scenarios"""
-        os.makedirs("testing/test_data", exist_ok=True)
+        self._ensure_dirs()
         
         students = []
         
@@ -1763,46 +1560,12 @@ class NoMutualPreferencesTest(TestCase):
         ])
         
         # CASE 5: Fill with individuals to make valid team sizes
+        prefs = {"ProjectEpsilon": 1, "ProjectAlpha": 2, "ProjectBeta": 3, "ProjectGamma": 4, "ProjectDelta": 5}
         for i in range(1, 8):
-            students.append((
-                f"individual_{i}",
-                [],
-                {"ProjectEpsilon": 1, "ProjectAlpha": 2, "ProjectBeta": 3, "ProjectGamma": 4, "ProjectDelta": 5}
-            ))
+            students.append((f"individual_{i}", [], prefs))
         
         # Write CSV
-        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Write header
-            header = ['Timestamp', 'Email', 'Name', 'NetID']
-            projects = ['ProjectAlpha', 'ProjectBeta', 'ProjectGamma', 'ProjectDelta', 'ProjectEpsilon']
-            for proj in projects:
-                header.append(f'Project Preferences [{proj}]')
-            for i in range(1, 6):
-                header.append(f'Team Member {i}')
-            writer.writerow(header)
-            
-            # Write student rows
-            for netid, subteam_members, prefs in students:
-                row = ['2024-01-01', f'{netid}@uw.edu', f'Test Student {netid}', netid]
-                
-                # Add project preferences
-                for proj in projects:
-                    if proj in prefs:
-                        rank = prefs[proj]
-                        row.append(f'#{rank} Choice')
-                    else:
-                        row.append('')
-                
-                # Add subteam members
-                for i in range(5):
-                    if i < len(subteam_members):
-                        row.append(subteam_members[i])
-                    else:
-                        row.append('')
-                
-                writer.writerow(row)
+        self._write_students_csv(students, self.PROJECTS)
         
         print(f"   Generated {len(students)} students with non-mutual preference scenarios:")
         print(f"   - CASE 1: One-way preference (A→B, B doesn't list A)")
@@ -1816,10 +1579,7 @@ class NoMutualPreferencesTest(TestCase):
         self.expected = "Non-mutual preferences should NOT form subteams, only mutual ones should"
         
         # Find where each student ended up
-        member_locations = {}
-        for project, team in assignments:
-            for member in team:
-                member_locations[member] = project
+        member_locations = {member: project for project, team in assignments for member in team}
         
         analysis_parts = []
         violations = []
@@ -1837,13 +1597,7 @@ class NoMutualPreferencesTest(TestCase):
                 analysis_parts.append("✓ One-way preference: A and B correctly NOT together")
         
         # Check circular non-mutual preferences (should NOT be together)
-        circular_locations = {}
-        for member in ['circular_A', 'circular_B', 'circular_C']:
-            if member in member_locations:
-                project = member_locations[member]
-                if project not in circular_locations:
-                    circular_locations[project] = []
-                circular_locations[project].append(member)
+        circular_locations = self._group_by_project(['circular_A', 'circular_B', 'circular_C'], member_locations)
         
         if circular_locations:
             if len(circular_locations) == 1 and len(circular_locations[list(circular_locations.keys())[0]]) == 3:
@@ -1862,13 +1616,7 @@ class NoMutualPreferencesTest(TestCase):
                 violations.append("Mutual preference: D and E should be together but are not")
         
         # Check complex chain (should NOT be together as a group)
-        complex_locations = {}
-        for member in ['complex_F', 'complex_G', 'complex_H', 'complex_I']:
-            if member in member_locations:
-                project = member_locations[member]
-                if project not in complex_locations:
-                    complex_locations[project] = []
-                complex_locations[project].append(member)
+        complex_locations = self._group_by_project(['complex_F', 'complex_G', 'complex_H', 'complex_I'], member_locations)
         
         if complex_locations:
             max_chain_size = max(len(members) for members in complex_locations.values())
@@ -1917,6 +1665,11 @@ class IncompatibleSubteamsTest(TestCase):
     - Are incompatible subteams properly identified and handled?
     - Can the algorithm still form valid teams despite incompatibilities?
     """
+    __slots__ = ()
+    PROJECTS = ('ProjectA', 'ProjectB', 'ProjectC', 'ProjectD', 'ProjectE',
+                'ProjectF', 'ProjectG', 'ProjectH', 'ProjectI', 'ProjectJ')
+    INCOMPAT1_MEMBERS = frozenset(f"incompat1_m{i}" for i in range(1, 5))
+    INCOMPAT2_MEMBERS = frozenset(f"incompat2_m{i}" for i in range(1, 5))
     
     def __init__(self):
         super().__init__(
@@ -1927,68 +1680,26 @@ class IncompatibleSubteamsTest(TestCase):
         
     def generate_csv(self):
         """Generate test CSV with incompatible subteams"""
-        os.makedirs("testing/test_data", exist_ok=True)
-        
-        students = []
+        self._ensure_dirs()
         
-        # Subteam 1 (4 members): Only interested in ProjectA-E
-        for i in range(1, 5):
-            students.append((
-                f"incompat1_m{i}",
-                [f"incompat1_m{j}" for j in range(1, 5) if j != i],
-                {"ProjectA": 1, "ProjectB": 2, "ProjectC": 3, "ProjectD": 4, "ProjectE": 5}
-            ))
-        
-        # Subteam 2 (4 members): Only interested in ProjectF-J (NO OVERLAP!)
-        for i in range(1, 5):
-            students.append((
-                f"incompat2_m{i}",
-                [f"incompat2_m{j}" for j in range(1, 5) if j != i],
-                {"ProjectF": 1, "ProjectG": 2, "ProjectH": 3, "ProjectI": 4, "ProjectJ": 5}
-            ))
+        # Mutual subteams are declared once and expanded per member
+        students = self._expand_subteams([
+            # Subteam 1 (4 members): Only interested in ProjectA-E
+            ([f"incompat1_m{j}" for j in range(1, 5)],
+             {"ProjectA": 1, "ProjectB": 2, "ProjectC": 3, "ProjectD": 4, "ProjectE": 5}),
+            
+            # Subteam 2 (4 members): Only interested in ProjectF-J (NO OVERLAP!)
+            ([f"incompat2_m{j}" for j in range(1, 5)],
+             {"ProjectF": 1, "ProjectG": 2, "ProjectH": 3, "ProjectI": 4, "ProjectJ": 5}),
+        ])
         
         # Individual students with overlapping preferences to help form teams
+        prefs = {"ProjectA": 1, "ProjectF": 2, "ProjectB": 3, "ProjectG": 4, "ProjectC": 5}  # Bridge preferences
         for i in range(1, 8):  # Increased from 5 to 8 to ensure enough students
-            students.append((
-                f"bridge_m{i}",
-                [],
-                {"ProjectA": 1, "ProjectF": 2, "ProjectB": 3, "ProjectG": 4, "ProjectC": 5}  # Bridge preferences
-            ))
+            students.append((f"bridge_m{i}", [], prefs))
         
         # Write CSV
-        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Write header
-            header = ['Timestamp', 'Email', 'Name', 'NetID']
-            projects = ['ProjectA', 'ProjectB', 'ProjectC', 'ProjectD', 'ProjectE',
-                       'ProjectF', 'ProjectG', 'ProjectH', 'ProjectI', 'ProjectJ']
-            for proj in projects:
-                header.append(f'Project Preferences [{proj}]')
-            for i in range(1, 6):
-                header.append(f'Team Member {i}')
-            writer.writerow(header)
-            
-            # Write student rows
-            for netid, subteam_members, prefs in students:
-                row = ['2024-01-01', f'{netid}@uw.edu', f'Test Student {netid}', netid]
-                
-                # Add project preferences
-                for proj in projects:
-                    if proj in prefs:
-                        rank = prefs[proj]
-                        row.append(f'#{rank} Choice')
-                    else:
-                        row.append('')
-                
-                # Add subteam members
-                for i in range(5):
-                    if i < len(subteam_members):
-                        row.append(subteam_members[i])
-                    else:
-                        row.append('')
-                
-                writer.writerow(row)
+        self._write_students_csv(students, self.PROJECTS)
         
         print(f"   Generated {len(students)} students with incompatible subteams:")
         print(f"   - Subteam 1 (4 members): Only interested in ProjectA-E")
@@ -2000,34 +1711,19 @@ class IncompatibleSubteamsTest(TestCase):
         self.expected = "Incompatible subteams should be handled gracefully and still form valid teams"
         
         # Find where each student ended up
-        member_locations = {}
-        for project, team in assignments:
-            for member in team:
-                member_locations[member] = project
+        member_locations = {member: project for project, team in assignments for member in team}
         
         analysis_parts = []
         violations = []
         
         # Check incompatible subteams
-        incompat1_members = {f"incompat1_m{i}" for i in range(1, 5)}
-        incompat2_members = {f"incompat2_m{i}" for i in range(1, 5)}
+        incompat1_members = self.INCOMPAT1_MEMBERS
+        incompat2_members = self.INCOMPAT2_MEMBERS
         
         # Check if incompatible subteams stayed together
-        incompat1_locations = {}
-        for member in incompat1_members:
-            if member in member_locations:
-                project = member_locations[member]
-                if project not in incompat1_locations:
-                    incompat1_locations[project] = []
-                incompat1_locations[project].append(member)
-        
-        incompat2_locations = {}
-        for member in incompat2_members:
-            if member in member_locations:
-                project = member_locations[member]
-                if project not in incompat2_locations:
-                    incompat2_locations[project] = []
-                incompat2_locations[project].append(member)
+        incompat1_locations = self._group_by_project(incompat1_members, member_locations)
+        
+        incompat2_locations = self._group_by_project(incompat2_members, member_locations)
         
         # Analyze results
         analysis_parts.append(f"Incompatible Subteam 1 (ProjectA-E preferences):")
@@ -2101,6 +1797,8 @@ class AllStudentsWantSameProjectTest(TestCase):
     - How does it handle capacity constraints?
     - Does it gracefully degrade to lower-ranked preferences?
     """
+    __slots__ = ()
+    PROJECTS = ('ProjectA', 'ProjectB', 'ProjectC')
     
     def __init__(self):
         super().__init__(
@@ -2111,51 +1809,17 @@ class AllStudentsWantSameProjectTest(TestCase):
         
     def generate_csv(self):
         """Generate test CSV where all students want the same project"""
-        os.makedirs("testing/test_data", exist_ok=True)
+        self._ensure_dirs()
         
         students = []
         
         # Create 20 students, all wanting ProjectA as #1 choice
+        prefs = {"ProjectA": 1, "ProjectB": 2, "ProjectC": 3}  # Only 3 projects available
         for i in range(1, 21):
-            students.append((
-                f"sameproject_m{i}",
-                [],  # No subteam preferences
-                {"ProjectA": 1, "ProjectB": 2, "ProjectC": 3}  # Only 3 projects available
-            ))
+            students.append((f"sameproject_m{i}", [], prefs))
         
         # Write CSV
-        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Write header
-            header = ['Timestamp', 'Email', 'Name', 'NetID']
-            projects = ['ProjectA', 'ProjectB', 'ProjectC']
-            for proj in projects:
-                header.append(f'Project Preferences [{proj}]')
-            for i in range(1, 6):
-                header.append(f'Team Member {i}')
-            writer.writerow(header)
-            
-            # Write student rows
-            for netid, subteam_members, prefs in students:
-                row = ['2024-01-01', f'{netid}@uw.edu', f'Test Student {netid}', netid]
-                
-                # Add project preferences
-                for proj in projects:
-                    if proj in prefs:
-                        rank = prefs[proj]
-                        row.append(f'#{rank} Choice')
-                    else:
-                        row.append('')
-                
-                # Add subteam members
-                for i in range(5):
-                    if i < len(subteam_members):
-                        row.append(subteam_members[i])
-                    else:
-                        row.append('')
-                
-                writer.writerow(row)
+        self._write_students_csv(students, self.PROJECTS)
         
         print(f"   Generated {len(students)} students all wanting ProjectA #1:")
         print(f"   - All 20 students have ProjectA as #1 choice")
@@ -2167,10 +1831,8 @@ class AllStudentsWantSameProjectTest(TestCase):
         self.expected = "Algorithm should handle capacity constraints by assigning lower-ranked preferences"
         
         # Analyze project distribution
-        project_usage = {}
+        project_usage = defaultdict(int)
         for project, team in assignments:
-            if project not in project_usage:
-                project_usage[project] = 0
             project_usage[project] += len(team)
         
         analysis_parts = []
@@ -2254,6 +1916,8 @@ class GreedyAssignmentOrderTest(TestCase):
     - Are there scenarios where teams get worse assignments due to greedy ordering?
     - Can the algorithm optimize for better overall satisfaction?
     """
+    __slots__ = ()
+    PROJECTS = ('ProjectA', 'ProjectB', 'ProjectC', 'ProjectD', 'ProjectE')
     
     def __init__(self):
         super().__init__(
@@ -2264,67 +1928,25 @@ class GreedyAssignmentOrderTest(TestCase):
         
     def generate_csv(self):
         """Generate test CSV to test greedy assignment order"""
-        os.makedirs("testing/test_data", exist_ok=True)
+        self._ensure_dirs()
         
-        students = []
-        
-        # Team 1 (5 members): ProjectA=#1, ProjectB=#2, ProjectC=#3
-        for i in range(1, 6):
-            students.append((
-                f"greedy1_m{i}",
-                [f"greedy1_m{j}" for j in range(1, 6) if j != i],
-                {"ProjectA": 1, "ProjectB": 2, "ProjectC": 3, "ProjectD": 4, "ProjectE": 5}
-            ))
-        
-        # Team 2 (6 members): ProjectB=#1, ProjectA=#2, ProjectC=#3
-        for i in range(1, 7):
-            students.append((
-                f"greedy2_m{i}",
-                [f"greedy2_m{j}" for j in range(1, 7) if j != i],
-                {"ProjectB": 1, "ProjectA": 2, "ProjectC": 3, "ProjectD": 4, "ProjectE": 5}
-            ))
-        
-        # Team 3 (5 members): ProjectC=#1, ProjectA=#2, ProjectB=#3
-        for i in range(1, 6):
-            students.append((
-                f"greedy3_m{i}",
-                [f"greedy3_m{j}" for j in range(1, 6) if j != i],
-                {"ProjectC": 1, "ProjectA": 2, "ProjectB": 3, "ProjectD": 4, "ProjectE": 5}
-            ))
+        # Mutual subteams are declared once and expanded per member
+        students = self._expand_subteams([
+            # Team 1 (5 members): ProjectA=#1, ProjectB=#2, ProjectC=#3
+            ([f"greedy1_m{j}" for j in range(1, 6)],
+             {"ProjectA": 1, "ProjectB": 2, "ProjectC": 3, "ProjectD": 4, "ProjectE": 5}),
+            
+            # Team 2 (6 members): ProjectB=#1, ProjectA=#2, ProjectC=#3
+            ([f"greedy2_m{j}" for j in range(1, 7)],
+             {"ProjectB": 1, "ProjectA": 2, "ProjectC": 3, "ProjectD": 4, "ProjectE": 5}),
+            
+            # Team 3 (5 members): ProjectC=#1, ProjectA=#2, ProjectB=#3
+            ([f"greedy3_m{j}" for j in range(1, 6)],
+             {"ProjectC": 1, "ProjectA": 2, "ProjectB": 3, "ProjectD": 4, "ProjectE": 5}),
+        ])
         
         # Write CSV
-        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Write header
-            header = ['Timestamp', 'Email', 'Name', 'NetID']
-            projects = ['ProjectA', 'ProjectB', 'ProjectC', 'ProjectD', 'ProjectE']
-            for proj in projects:
-                header.append(f'Project Preferences [{proj}]')
-            for i in range(1, 6):
-                header.append(f'Team Member {i}')
-            writer.writerow(header)
-            
-            # Write student rows
-            for netid, subteam_members, prefs in students:
-                row = ['2024-01-01', f'{netid}@uw.edu', f'Test Student {netid}', netid]
-                
-                # Add project preferences
-                for proj in projects:
-                    if proj in prefs:
-                        rank = prefs[proj]
-                        row.append(f'#{rank} Choice')
-                    else:
-                        row.append('')
-                
-                # Add subteam members
-                for i in range(5):
-                    if i < len(subteam_members):
-                        row.append(subteam_members[i])
-                    else:
-                        row.append('')
-                
-                writer.writerow(row)
+        self._write_students_csv(students, self.PROJECTS)
         
         print(f"   Generated {len(students)} students to test greedy assignment:")
         print(f"   - Team 1 (5 members): ProjectA=#1, ProjectB=#2, ProjectC=#3")
@@ -2426,6 +2048,8 @@ class TieBreakingTest(TestCase):
     - Is the tie-breaking mechanism fair?
     - Do both teams get reasonable assignments despite the conflict?
     """
+    __slots__ = ()
+    PROJECTS = ('ProjectA', 'ProjectB', 'ProjectC', 'ProjectD', 'ProjectE')
     
     def __init__(self):
         super().__init__(
@@ -2436,67 +2060,26 @@ class TieBreakingTest(TestCase):
         
     def generate_csv(self):
         """Generate test CSV to test tie-breaking"""
-        os.makedirs("testing/test_data", exist_ok=True)
-        
-        students = []
+        self._ensure_dirs()
         
-        # Subteam 1 (3 members): ProjectA=#1, ProjectB=#2, ProjectC=#3
-        for i in range(1, 4):
-            students.append((
-                f"tie1_m{i}",
-                [f"tie1_m{j}" for j in range(1, 4) if j != i],
-                {"ProjectA": 1, "ProjectB": 2, "ProjectC": 3, "ProjectD": 4, "ProjectE": 5}
-            ))
-        
-        # Subteam 2 (3 members): ProjectA=#1, ProjectB=#2, ProjectC=#3 (SAME PREFERENCES!)
-        for i in range(1, 4):
-            students.append((
-                f"tie2_m{i}",
-                [f"tie2_m{j}" for j in range(1, 4) if j != i],
-                {"ProjectA": 1, "ProjectB": 2, "ProjectC": 3, "ProjectD": 4, "ProjectE": 5}
-            ))
+        # Mutual subteams are declared once and expanded per member
+        students = self._expand_subteams([
+            # Subteam 1 (3 members): ProjectA=#1, ProjectB=#2, ProjectC=#3
+            ([f"tie1_m{j}" for j in range(1, 4)],
+             {"ProjectA": 1, "ProjectB": 2, "ProjectC": 3, "ProjectD": 4, "ProjectE": 5}),
+            
+            # Subteam 2 (3 members): ProjectA=#1, ProjectB=#2, ProjectC=#3 (SAME PREFERENCES!)
+            ([f"tie2_m{j}" for j in range(1, 4)],
+             {"ProjectA": 1, "ProjectB": 2, "ProjectC": 3, "ProjectD": 4, "ProjectE": 5}),
+        ])
         
         # Individual students to fill out teams
+        prefs = {"ProjectB": 1, "ProjectC": 2, "ProjectA": 3, "ProjectD": 4, "ProjectE": 5}
         for i in range(1, 12):  # Increased to 12 to ensure enough students for 3 teams
-            students.append((
-                f"tie_filler_m{i}",
-                [],
-                {"ProjectB": 1, "ProjectC": 2, "ProjectA": 3, "ProjectD": 4, "ProjectE": 5}
-            ))
+            students.append((f"tie_filler_m{i}", [], prefs))
         
         # Write CSV
-        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Write header
-            header = ['Timestamp', 'Email', 'Name', 'NetID']
-            projects = ['ProjectA', 'ProjectB', 'ProjectC', 'ProjectD', 'ProjectE']
-            for proj in projects:
-                header.append(f'Project Preferences [{proj}]')
-            for i in range(1, 6):
-                header.append(f'Team Member {i}')
-            writer.writerow(header)
-            
-            # Write student rows
-            for netid, subteam_members, prefs in students:
-                row = ['2024-01-01', f'{netid}@uw.edu', f'Test Student {netid}', netid]
-                
-                # Add project preferences
-                for proj in projects:
-                    if proj in prefs:
-                        rank = prefs[proj]
-                        row.append(f'#{rank} Choice')
-                    else:
-                        row.append('')
-                
-                # Add subteam members
-                for i in range(5):
-                    if i < len(subteam_members):
-                        row.append(subteam_members[i])
-                    else:
-                        row.append('')
-                
-                writer.writerow(row)
+        self._write_students_csv(students, self.PROJECTS)
         
         print(f"   Generated {len(students)} students to test tie-breaking:")
         print(f"   - Subteam 1 (3 members): ProjectA=#1, ProjectB=#2, ProjectC=#3")
@@ -2587,6 +2170,8 @@ class MissingNetIDTest(TestCase):
     - Does it warn the user about missing data?
     - Does it continue processing valid rows?
     """
+    __slots__ = ()
+    PROJECTS = ('ProjectA', 'ProjectB', 'ProjectC')
     
     def __init__(self):
         super().__init__(
@@ -2597,32 +2182,30 @@ class MissingNetIDTest(TestCase):
         
     def generate_csv(self):
         """Generate test CSV with missing NetIDs"""
-        os.makedirs("testing/test_data", exist_ok=True)
+        self._ensure_dirs()
         
         # Create CSV with missing NetIDs
-        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
+        with open(self.csv_path, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             
             # Write header
-            header = ['Timestamp', 'Email', 'Name', 'NetID']
-            projects = ['ProjectA', 'ProjectB', 'ProjectC']
-            for proj in projects:
-                header.append(f'Project Preferences [{proj}]')
-            for i in range(1, 6):
-                header.append(f'Team Member {i}')
-            writer.writerow(header)
+            f.write(_header_line(self.PROJECTS))
             
             # Create enough valid students to form teams
-            for i in range(1, 11):  # 10 valid students to form 2 teams
-                writer.writerow([f'2024-01-01', f'valid{i}@uw.edu', f'Valid Student {i}', f'valid_student{i}',
-                               '#1 Choice', '#2 Choice', '#3 Choice', '', '', '', '', '', '', ''])
+            rows = [
+                [f'2024-01-01', f'valid{i}@uw.edu', f'Valid Student {i}', f'valid_student{i}',
+                 '#1 Choice', '#2 Choice', '#3 Choice', '', '', '', '', '', '', '']
+                for i in range(1, 11)  # 10 valid students to form 2 teams
+            ]
             
             # Add some missing NetIDs for testing
-            writer.writerow(['2024-01-01', 'missing@uw.edu', 'Missing Student', '',
-                           '#1 Choice', '#2 Choice', '#3 Choice', '', '', '', '', '', '', ''])
+            rows.append(['2024-01-01', 'missing@uw.edu', 'Missing Student', '',
+                         '#1 Choice', '#2 Choice', '#3 Choice', '', '', '', '', '', '', ''])
             
-            writer.writerow(['2024-01-01', 'whitespace@uw.edu', 'Whitespace Student', '   ',
-                           '#1 Choice', '#2 Choice', '#3 Choice', '', '', '', '', '', '', ''])
+            rows.append(['2024-01-01', 'whitespace@uw.edu', 'Whitespace Student', '   ',
+                         '#1 Choice', '#2 Choice', '#3 Choice', '', '', '', '', '', '', ''])
+            
+            writer.writerows(rows)
         
         print(f"   Generated test CSV with missing NetIDs:")
         print(f"   - 10 valid students with NetIDs")
@@ -2701,6 +2284,8 @@ class InvalidPreferenceFormatTest(TestCase):
     - Does it warn the user about malformed data?
     - Does it continue processing valid rows?
     """
+    __slots__ = ()
+    PROJECTS = ('ProjectA', 'ProjectB', 'ProjectC')
     
     def __init__(self):
         super().__init__(
@@ -2711,35 +2296,33 @@ class InvalidPreferenceFormatTest(TestCase):
         
     def generate_csv(self):
         """Generate test CSV with invalid preference formats"""
-        os.makedirs("testing/test_data", exist_ok=True)
+        self._ensure_dirs()
         
         # Create CSV with invalid preference formats
-        with open(self.csv_path, 'w', newline='', encoding='utf-8') as f:
+        with open(self.csv_path, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             
             # Write header
-            header = ['Timestamp', 'Email', 'Name', 'NetID']
-            projects = ['ProjectA', 'ProjectB', 'ProjectC']
-            for proj in projects:
-                header.append(f'Project Preferences [{proj}]')
-            for i in range(1, 6):
-                header.append(f'Team Member {i}')
-            writer.writerow(header)
+            f.write(_header_line(self.PROJECTS))
             
             # Create enough valid students to form teams
-            for i in range(1, 16):  # 15 valid students to form 3 teams
-                writer.writerow([f'2024-01-01', f'valid{i}@uw.edu', f'Valid Student {i}', f'valid_student{i}',
-                               '#1 Choice', '#2 Choice', '#3 Choice', '', '', '', '', '', '', ''])
+            rows = [
+                [f'2024-01-01', f'valid{i}@uw.edu', f'Valid Student {i}', f'valid_student{i}',
+                 '#1 Choice', '#2 Choice', '#3 Choice', '', '', '', '', '', '', '']
+                for i in range(1, 16)  # 15 valid students to form 3 teams
+            ]
             
             # Add some invalid preference formats for testing
-            writer.writerow(['2024-01-01', 'invalid1@uw.edu', 'Invalid Student 1', 'invalid_student1',
-                           '1 Choice', '#2 Choice', '#3 Choice', '', '', '', '', '', '', ''])
+            rows.append(['2024-01-01', 'invalid1@uw.edu', 'Invalid Student 1', 'invalid_student1',
+                         '1 Choice', '#2 Choice', '#3 Choice', '', '', '', '', '', '', ''])
             
-            writer.writerow(['2024-01-01', 'invalid2@uw.edu', 'Invalid Student 2', 'invalid_student2',
-                           '# Choice', '#2 Choice', '#3 Choice', '', '', '', '', '', '', ''])
+            rows.append(['2024-01-01', 'invalid2@uw.edu', 'Invalid Student 2', 'invalid_student2',
+                         '# Choice', '#2 Choice', '#3 Choice', '', '', '', '', '', '', ''])
             
-            writer.writerow(['2024-01-01', 'invalid3@uw.edu', 'Invalid Student 3', 'invalid_student3',
-                           '#A Choice', '#2 Choice', '#3 Choice', '', '', '', '', '', '', ''])
+            rows.append(['2024-01-01', 'invalid3@uw.edu', 'Invalid Student 3', 'invalid_student3',
+                         '#A Choice', '#2 Choice', '#3 Choice', '', '', '', '', '', '', ''])
+            
+            writer.writerows(rows)
         
         print(f"   Generated test CSV with invalid preference formats:")
         print(f"   - 10 valid students with proper #X Choice format")
@@ -2812,6 +2395,15 @@ class InvalidPreferenceFormatTest(TestCase):
             return True, full_message
 
 
+def _run_test(test: TestCase) -> Tuple[Dict, str]:
+    """Run one test in a worker process, returning its result and printed log"""
+    # Capture stderr too, so tracebacks stay with the test that raised them
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        result = test.run()
+    return result, log.getvalue()
+
+
 class TestRunner:
     """Main test runner"""
     
@@ -2830,12 +2422,16 @@ class TestRunner:
         print("="*70)
         print(f"Running {len(self.tests)} test case(s)...")
         
-        # Create results directory
-        os.makedirs("testing/test_results", exist_ok=True)
+        # Create data and results directories
+        TestCase._ensure_dirs()
         
-        for test in self.tests:
-            result = test.run()
-            self.results.append(result)
+        # Tests write to their own files, so run them in parallel and print
+        # each captured log in the original order
+        workers = max(1, min(len(self.tests), os.cpu_count() or 1))
+        with multiprocessing.Pool(workers) as pool:
+            for result, log in pool.imap(_run_test, self.tests):
+                print(log, end='')
+                self.results.append(result)
         
         # Print summary
         self.print_summary()
@@ -10,12 +10,53 @@ FIXES:
 """
 
 import csv
-import re
-from collections import defaultdict
-from typing import List, Dict, Set, Tuple
+import os
+from operator import itemgetter
+from collections import defaultdict, deque
+from typing import Callable, List, Dict, Optional, Set, Tuple
 import sys
 
 
+# Read buffer for the preferences CSV, so wide files are read in few syscalls
+INPUT_BUFFER_SIZE = 1 << 20
+
+# Write buffer for the output CSV, so rows are flushed in large blocks
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+def parse_preference_rank(pref_value: str) -> Optional[int]:
+    """
+    Return N from the first "#N" in a cell like "#1 Choice", or None.
+    
+    Plain string scanning is much cheaper than running a regex on every
+    student x project cell.
+    """
+    start = pref_value.find('#')
+    while start != -1:
+        end = start + 1
+        while end < len(pref_value) and pref_value[end].isdecimal():
+            end += 1
+        if end > start + 1:
+            return int(pref_value[start + 1:end])
+        start = pref_value.find('#', end)
+    return None
+
+
+def column_getter(indices: List[int]) -> Callable[[List[str]], Tuple[str, ...]]:
+    """
+    Return a function that extracts the given columns of a row as a tuple.
+    
+    Uses operator.itemgetter so each row is sliced in C; itemgetter returns a
+    bare value for a single index, so that case is wrapped to stay a tuple.
+    """
+    if not indices:
+        return lambda row: ()
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda row: (row[index],)
+    return itemgetter(*indices)
+
+
 class TeamAssignment:
     def __init__(self, csv_path: str):
         self.csv_path = csv_path
@@ -26,7 +67,11 @@ class TeamAssignment:
         
     def parse_csv(self):
         """Parse the CSV file to extract student preferences."""
-        with open(self.csv_path, 'r', encoding='utf-8') as f:
+        with open(self.csv_path, 'r', encoding='utf-8', buffering=INPUT_BUFFER_SIZE) as f:
+            # The file is read front to back once; let the kernel prefetch ahead (Linux only)
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            
             reader = csv.reader(f)
             headers = next(reader)
             
@@ -42,59 +87,75 @@ class TeamAssignment:
                 if i < 4:  # Skip timestamp, email, name, netid
                     continue
                 # If column header contains brackets, it's a project
-                if '[' in col and ']' in col:
-                    project_name = col.split('[')[1].split(']')[0]
+                # (find() the bracket positions instead of allocating split() lists)
+                left_bracket = col.find('[')
+                right_bracket = col.find(']', left_bracket + 1) if left_bracket != -1 else -1
+                if right_bracket != -1:
+                    project_name = col[left_bracket + 1:right_bracket]
                     project_cols.append((i, project_name))
                     self.projects.add(project_name)
                 # If column header contains "Team Member", it's a subteam column
                 elif 'Team Member' in col:
                     subteam_cols.append(i)
             
+            # Split the column layout once so each row is read column-by-column
+            # without per-cell bounds checks (short rows are padded instead)
+            project_col_indices = [col_idx for col_idx, _ in project_cols]
+            project_names = [project_name for _, project_name in project_cols]
+            row_width = max(project_col_indices + subteam_cols + [netid_idx]) + 1
+            get_pref_values = column_getter(project_col_indices)
+            get_member_values = column_getter(subteam_cols)
+            
             # Process each student
             for row in reader:
                 if len(row) <= netid_idx:
                     continue
                     
-                netid = row[netid_idx].strip()
+                # Netids are interned so the many dict/set lookups compare by identity first
+                netid = sys.intern(row[netid_idx].strip())
                 if not netid:
                     continue
+                
+                if len(row) < row_width:
+                    row.extend([''] * (row_width - len(row)))
                     
                 # Get project preferences
                 project_prefs = {}
-                for col_idx, project_name in project_cols:
-                    if col_idx < len(row):
-                        pref_value = row[col_idx]
-                        if pref_value and pref_value.strip():
-                            # Extract preference number from "#1 Choice", "#2 Choice", etc.
-                            match = re.search(r'#(\d+)', pref_value)
-                            if match:
-                                pref_rank = int(match.group(1))
-                                project_prefs[project_name] = pref_rank
+                for project_name, pref_value in zip(project_names, get_pref_values(row)):
+                    if pref_value and pref_value.strip():
+                        # Extract preference number from "#1 Choice", "#2 Choice", etc.
+                        pref_rank = parse_preference_rank(pref_value)
+                        if pref_rank is not None:
+                            project_prefs[project_name] = pref_rank
                 
                 # Get subteam members
                 subteam_members = set()
-                for col_idx in subteam_cols:
-                    if col_idx < len(row):
-                        member_value = row[col_idx]
-                        if member_value and member_value.strip():
-                            # Extract netid from entries like "Name, netid"
-                            member_str = member_value.strip()
-                            # Try different formats
-                            if ',' in member_str:
-                                parts = member_str.split(',')
-                                member_netid = parts[-1].strip()
-                            else:
-                                # Just the netid
-                                member_netid = member_str
-                            
-                            # Clean up the netid
-                            member_netid = member_netid.replace('@uw.edu', '').strip()
-                            if member_netid and member_netid != netid:
-                                subteam_members.add(member_netid)
+                for member_value in get_member_values(row):
+                    if member_value and member_value.strip():
+                        # Extract netid from entries like "Name, netid"
+                        member_str = member_value.strip()
+                        # Try different formats
+                        if ',' in member_str:
+                            parts = member_str.split(',')
+                            member_netid = parts[-1].strip()
+                        else:
+                            # Just the netid
+                            member_netid = member_str
+                        
+                        # Clean up the netid
+                        member_netid = sys.intern(member_netid.replace('@uw.edu', '').strip())
+                        if member_netid and member_netid != netid:
+                            subteam_members.add(member_netid)
                 
                 self.students[netid] = {
                     'netid': netid,
                     'projects': project_prefs,
+                    # (project, rank) pairs sorted best rank first, built once for assignment
+                    'ranked_projects': sorted(project_prefs.items(), key=itemgetter(1)),
+                    # Hashable copy of the preferences for subteam consistency checks
+                    'preference_signature': frozenset(project_prefs.items()),
+                    # Top-5 projects, precomputed once for the many team compatibility checks
+                    'top_projects': frozenset(p for p, rank in project_prefs.items() if rank <= 5),
                     'subteam_members': subteam_members
                 }
         
@@ -102,76 +163,80 @@ class TeamAssignment:
     
     def form_subteams(self):
         """Form subteams based on mutual preferences."""
-        visited = set()
-        
-        for netid in self.students:
-            if netid in visited:
-                continue
-            
-            # Find all students who mutually list each other
-            subteam = self._find_connected_subteam(netid, visited)
-            
-            if subteam:
-                # Verify project preferences are consistent
-                if self._verify_project_consistency(subteam):
-                    self.subteams.append(subteam)
-                    visited.update(subteam)
-                else:
-                    # If not consistent, treat each as individual
-                    print(f"Warning: Subteam {subteam} has inconsistent preferences, splitting")
-                    for student in subteam:
-                        self.subteams.append([student])
-                        visited.add(student)
+        # Each group of students who (transitively) mutually list each other
+        for subteam in self._find_mutual_subteams():
+            # Verify project preferences are consistent
+            if self._verify_project_consistency(subteam):
+                self.subteams.append(subteam)
+            else:
+                # If not consistent, treat each as individual
+                print(f"Warning: Subteam {subteam} has inconsistent preferences, splitting")
+                for student in subteam:
+                    self.subteams.append([student])
         
         print(f"Formed {len(self.subteams)} subteams")
         for i, subteam in enumerate(self.subteams):
             print(f"  Subteam {i+1}: {len(subteam)} members")
     
-    def _find_connected_subteam(self, start_netid: str, visited: Set[str]) -> List[str]:
-        """Find all mutually connected students forming a subteam."""
-        if start_netid in visited:
-            return []
-        
-        # Use BFS to find all connected members
-        subteam = {start_netid}
-        to_check = [start_netid]
-        
-        while to_check:
-            current = to_check.pop(0)
-            if current not in self.students:
-                continue
-                
-            # Get members this student wants
-            wanted_members = self.students[current]['subteam_members']
-            
-            for member in wanted_members:
-                if member in subteam or member in visited:
-                    continue
-                if member not in self.students:
-                    continue
-                
-                # Check if it's mutual
-                their_members = self.students[member]['subteam_members']
-                if current in their_members:
-                    subteam.add(member)
-                    to_check.append(member)
+    def _find_mutual_subteams(self) -> List[List[str]]:
+        """
+        Find all groups of mutually connected students.
+        
+        Two students are connected when each lists the other as a subteam
+        member. Groups are built with a union-find (path compression + union
+        by rank) in a single pass over the listed members, instead of a
+        separate BFS per student. Students are numbered once so the union-find
+        state lives in flat parent/rank lists rather than netid-keyed dicts.
         
-        return list(subteam)
+        Returns: Groups in order of their first student, members in CSV order
+        """
+        netids = list(self.students)
+        index = {netid: i for i, netid in enumerate(netids)}
+        parent = list(range(len(netids)))
+        rank = [0] * len(netids)
+        
+        def find(i: int) -> int:
+            root = i
+            while parent[root] != root:
+                root = parent[root]
+            # Point every student on the path directly at the root
+            while parent[i] != root:
+                parent[i], i = root, parent[i]
+            return root
+        
+        def union(i: int, j: int):
+            root1, root2 = find(i), find(j)
+            if root1 == root2:
+                return
+            if rank[root1] < rank[root2]:
+                root1, root2 = root2, root1
+            parent[root2] = root1
+            if rank[root1] == rank[root2]:
+                rank[root1] += 1
+        
+        for i, netid in enumerate(netids):
+            for member in self.students[netid]['subteam_members']:
+                j = index.get(member)
+                # Only mutual listings connect two students; each pair is seen
+                # from both sides, so handle it from the lower-numbered one
+                if j is not None and j > i and netid in self.students[member]['subteam_members']:
+                    union(i, j)
+        
+        groups = defaultdict(list)
+        for i, netid in enumerate(netids):
+            groups[find(i)].append(netid)
+        
+        return list(groups.values())
     
     def _verify_project_consistency(self, subteam: List[str]) -> bool:
         """Verify that all members have the same project preferences."""
         if len(subteam) <= 1:
             return True
         
-        # Get the first member's preferences
-        first_prefs = self.students[subteam[0]]['projects']
-        
-        # Check that all members have the same preferences
-        for netid in subteam[1:]:
-            if self.students[netid]['projects'] != first_prefs:
-                return False
-        
-        return True
+        # Members agree when they all share one preference signature; the
+        # signatures' cached hashes reject most mismatches without a full compare
+        signatures = {self.students[netid]['preference_signature'] for netid in subteam}
+        return len(signatures) == 1
     
     def _get_common_projects(self, team1: List[str], team2: List[str]) -> Set[str]:
         """
@@ -187,18 +252,11 @@ class TeamAssignment:
         
         # Get the first member's top 5 projects
         first_member = all_members[0]
-        common_projects = set([
-            p for p, rank in self.students[first_member]['projects'].items() 
-            if rank <= 5
-        ])
+        common_projects = set(self.students[first_member]['top_projects'])
         
         # Intersect with each other member's top 5
         for member in all_members[1:]:
-            member_top5 = set([
-                p for p, rank in self.students[member]['projects'].items() 
-                if rank <= 5
-            ])
-            common_projects &= member_top5  # Intersection
+            common_projects &= self.students[member]['top_projects']  # Intersection
         
         return common_projects
     
@@ -213,30 +271,29 @@ class TeamAssignment:
             return [subteam]
         
         split_teams = []
-        remaining_members = subteam[:]
+        # Members are taken from the front, so use a deque (O(1) popleft)
+        # instead of re-slicing the remaining list for every team
+        remaining_members = deque(subteam)
         
         # Greedy approach: try to form teams of 6 first, then 5
-        while len(remaining_members) > 0:
+        while remaining_members:
             if len(remaining_members) >= 6:
                 # Take 6 members for this team
-                team = remaining_members[:6]
-                remaining_members = remaining_members[6:]
+                team = [remaining_members.popleft() for _ in range(6)]
                 split_teams.append(team)
             elif len(remaining_members) >= 5:
                 # Take 5 members for this team
-                team = remaining_members[:5]
-                remaining_members = remaining_members[5:]
+                team = [remaining_members.popleft() for _ in range(5)]
                 split_teams.append(team)
             else:
                 # Less than 5 members left - need to merge with previous team
                 if split_teams and len(split_teams[-1]) + len(remaining_members) <= 6:
                     # Can add to the last team
                     split_teams[-1].extend(remaining_members)
-                    remaining_members = []
                 else:
                     # Create a small team that will need to be merged later
-                    split_teams.append(remaining_members[:])
-                    remaining_members = []
+                    split_teams.append(list(remaining_members))
+                remaining_members.clear()
         
         # Ensure all split teams have valid sizes (5-6 members)
         final_teams = []
@@ -255,6 +312,48 @@ class TeamAssignment:
         print(f"    Split into {len(final_teams)} teams: {[len(team) for team in final_teams]}")
         return final_teams
     
+    def _pack_subteams(self, subteams: List[List[str]]) -> List[List[str]]:
+        """
+        Pack subteams of fewer than 5 members into teams using first-fit-decreasing.
+        
+        Subteams are placed largest first into the first team that still has
+        room for them (max 6) and shares at least one top-5 project with them;
+        otherwise they start a new team. Teams left under 5 members then take
+        single-student subteams from teams of 6, so no subteam is ever split.
+        
+        Returns: Packed teams (some may still have fewer than 5 members)
+        """
+        packed_teams = []     # members of each packed team
+        packed_subteams = []  # subteams packed into each team
+        
+        for subteam in sorted(subteams, key=len, reverse=True):
+            for members, packed in zip(packed_teams, packed_subteams):
+                # FIX FOR TEST 3: Only combine subteams with compatible project preferences
+                if len(members) + len(subteam) <= 6 and self._get_common_projects(members, subteam):
+                    members.extend(subteam)
+                    packed.append(subteam)
+                    break
+            else:
+                packed_teams.append(subteam[:])
+                packed_subteams.append([subteam])
+        
+        # Top up teams under 5 members with single students from the fullest teams
+        for members, packed in zip(packed_teams, packed_subteams):
+            donors = sorted(zip(packed_teams, packed_subteams), key=lambda donor: len(donor[0]), reverse=True)
+            for donor_members, donor_packed in donors:
+                if len(members) >= 5 or len(donor_members) <= 5:
+                    break
+                for single in [s for s in donor_packed if len(s) == 1]:
+                    if len(members) >= 5 or len(donor_members) <= 5:
+                        break
+                    if self._get_common_projects(members, single):
+                        donor_packed.remove(single)
+                        donor_members.remove(single[0])
+                        packed.append(single)
+                        members.extend(single)
+        
+        return packed_teams
+    
     def form_teams(self):
         """
         Combine subteams into teams of 5-6 members.
@@ -262,62 +361,34 @@ class TeamAssignment:
         FIX FOR TEST 1: Ensures all teams have 5-6 members by merging small teams.
         FIX FOR TEST 3: Checks project compatibility before combining subteams.
         """
-        # Sort subteams by size (larger first)
-        sorted_subteams = sorted(self.subteams, key=len, reverse=True)
+        # Bucket subteams by size in one pass (CSV order is kept within a size)
+        subteams_by_size = defaultdict(list)
+        for subteam in self.subteams:
+            subteams_by_size[len(subteam)].append(subteam)
+        sizes = sorted(subteams_by_size, reverse=True)
         
         # Handle subteams larger than 6 by splitting them intelligently
         split_subteams = []
-        for subteam in sorted_subteams[:]:
-            if len(subteam) > 6:
+        for size in sizes:
+            if size <= 6:
+                break
+            for subteam in subteams_by_size[size]:
                 print(f"  Splitting large subteam of {len(subteam)} members: {subteam}")
                 # Split into teams of 5-6 members
-                split_teams = self._split_large_subteam(subteam)
-                split_subteams.extend(split_teams)
-                sorted_subteams.remove(subteam)
-        
-        # Add split subteams back to the list
-        sorted_subteams.extend(split_subteams)
-        
-        # Subteams of size 5-6 become teams immediately
-        for subteam in sorted_subteams[:]:
-            if 5 <= len(subteam) <= 6:
-                self.teams.append(subteam)
-                sorted_subteams.remove(subteam)
-        
-        # Combine smaller subteams using improved bin-packing with compatibility check
-        used = set()
-        for i, subteam in enumerate(sorted_subteams):
-            if i in used:
-                continue
-            
-            current_team = subteam[:]
+                split_subteams.extend(self._split_large_subteam(subteam))
+        
+        # Subteams of size 5-6 become teams immediately, then valid split teams
+        self.teams.extend(subteams_by_size[6])
+        self.teams.extend(subteams_by_size[5])
+        self.teams.extend(subteam for subteam in split_subteams if 5 <= len(subteam) <= 6)
+        
+        # Everything under 5 members still needs to be combined
+        small_subteams = [subteam for size in sizes if size < 5 for subteam in subteams_by_size[size]]
+        small_subteams.extend(subteam for subteam in split_subteams if len(subteam) < 5)
+        
+        # Combine smaller subteams using first-fit-decreasing bin packing with compatibility check
+        for current_team in self._pack_subteams(small_subteams):
             current_size = len(current_team)
-            used.add(i)
-            
-            # Try to add more subteams to reach 5-6
-            for j, other_subteam in enumerate(sorted_subteams):
-                if j in used or j <= i:
-                    continue
-                
-                new_size = current_size + len(other_subteam)
-                
-                # Only add if it keeps us at or below 6
-                if new_size <= 6:
-                    # FIX FOR TEST 3: Check if they have compatible project preferences
-                    common_projects = self._get_common_projects(current_team, other_subteam)
-                    
-                    if common_projects:
-                        # They have at least one project in common, safe to combine
-                        current_team.extend(other_subteam)
-                        current_size = new_size
-                        used.add(j)
-                        
-                        # If we've reached valid size, stop adding
-                        if current_size >= 5:
-                            break
-                    else:
-                        # No common projects, skip this combination
-                        print(f"  Skipping combination: no common projects between {current_team} and {other_subteam}")
             
             # Only add teams that meet the size constraint (5-6 members)
             if current_size >= 5 and current_size <= 6:
@@ -371,18 +442,11 @@ class TeamAssignment:
             return {}
         
         # Get the first member's top 5 projects
-        valid_projects = set([
-            p for p, rank in self.students[team[0]]['projects'].items() 
-            if rank <= 5
-        ])
+        valid_projects = set(self.students[team[0]]['top_projects'])
         
         # Intersect with each other member's top 5
         for member in team[1:]:
-            member_top5 = set([
-                p for p, rank in self.students[member]['projects'].items() 
-                if rank <= 5
-            ])
-            valid_projects &= member_top5  # Intersection
+            valid_projects &= self.students[member]['top_projects']  # Intersection
         
         # Calculate scores for valid projects
         # Score = sum of (6 - rank) for each member
@@ -405,26 +469,27 @@ class TeamAssignment:
         project_assignments = []
         used_projects = set()
         
+        # FIX FOR TEST 3: Get projects valid for ALL members (scored once per team,
+        # shared by the sort below and the assignment loop)
+        team_valid_projects = [(team, self._get_valid_projects_for_team(team)) for team in self.teams]
+        
         # Sort teams by how constrained they are (fewer valid projects = higher priority)
-        def team_constraint(team):
-            valid_projects = self._get_valid_projects_for_team(team)
+        def team_constraint(team_and_projects):
+            team, valid_projects = team_and_projects
             return (len(valid_projects), -len(team))  # Fewer projects first, then larger teams
         
-        sorted_teams = sorted(self.teams, key=team_constraint)
+        sorted_teams = sorted(team_valid_projects, key=team_constraint)
         
-        for team in sorted_teams:
-            # FIX FOR TEST 3: Get projects valid for ALL members
-            valid_projects = self._get_valid_projects_for_team(team)
-            
+        for team, valid_projects in sorted_teams:
             if not valid_projects:
                 # ERROR: No project satisfies all members!
                 print(f"ERROR: Team {team} has no projects in all members' top 5!")
                 print(f"  This team should not have been formed.")
                 # Assign the first member's #1 choice as fallback (will violate constraint)
                 first_member = team[0]
-                prefs = self.students[first_member]['projects']
-                if prefs:
-                    assigned_project = min(prefs.items(), key=lambda x: x[1])[0]
+                ranked_projects = self.students[first_member]['ranked_projects']
+                if ranked_projects:
+                    assigned_project = ranked_projects[0][0]
                 else:
                     assigned_project = list(self.projects)[0]
                 project_assignments.append((assigned_project, team))
@@ -458,8 +523,6 @@ class TeamAssignment:
     
     def save_output(self, assignments: List[Tuple[str, List[str]]], output_path: str):
         """Save the assignments to a CSV file."""
-        import os
-        
         # Create directory if it doesn't exist
         output_dir = os.path.dirname(output_path)
         if output_dir and not os.path.exists(output_dir):
@@ -469,11 +532,10 @@ class TeamAssignment:
                 # If we can't create /workspace, use current directory
                 output_path = 'out.csv'
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
             writer = csv.writer(f)
-            for project, team in assignments:
-                team_str = str(team)
-                writer.writerow([project, team_str])
+            # Team column is the Python list string, e.g. "['m1', 'm2', ...]"
+            writer.writerows((project, str(team)) for project, team in assignments)
         print(f"Saved output to {output_path}")
     
     def run(self, output_path: str):